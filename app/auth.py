@@ -1,26 +1,40 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy import case, literal_column, true
+from sqlalchemy.ext.asyncio import AsyncSession
 import firebase_admin
-from firebase_admin import auth, credentials
+from firebase_admin import credentials
+import jwt
 import os
-from typing import Optional, Callable
-from functools import wraps
-from datetime import datetime, timedelta
+from typing import Optional, Callable, NamedTuple, Mapping, Tuple
+from functools import wraps, lru_cache
+from types import MappingProxyType
+import threading
+from cachetools import TTLCache
 import logging
-from .database import get_db
+from .database import get_async_db, dialect_insert
+from .cache import invalidate_role_counts
 from .models import User, RoleEnum
+from .token_cache import get_cached_claims, cache_claims
+from . import jwt_batcher
 
 # Configure logging for authentication events
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Initialize Firebase Admin SDK with proper error handling
+# Serializes initialization across threads (e.g. --workers with --preload)
+_firebase_init_lock = threading.Lock()
+
 def initialize_firebase():
-    """Initialize Firebase Admin SDK with proper configuration"""
-    try:
-        # Check if Firebase is already initialized
-        if not firebase_admin._apps:
+    """Initialize Firebase Admin SDK with proper configuration (idempotent)"""
+    with _firebase_init_lock:
+        try:
+            firebase_admin.get_app()
+            return
+        except ValueError:
+            pass
+        
+        try:
             # Try to load service account key from environment
             service_account_path = os.getenv("FIREBASE_SERVICE_ACCOUNT_PATH")
             if service_account_path and os.path.exists(service_account_path):
@@ -31,16 +45,37 @@ def initialize_firebase():
                 # For development, use default credentials
                 firebase_admin.initialize_app()
                 logger.info("Firebase Admin SDK initialized with default credentials")
-    except Exception as e:
-        logger.error(f"Failed to initialize Firebase Admin SDK: {e}")
-        raise
-
-# Initialize Firebase on module import
-initialize_firebase()
+        except Exception as e:
+            logger.error("Failed to initialize Firebase Admin SDK: %s", e)
+            raise
 
 # Security scheme for JWT tokens
 security = HTTPBearer(auto_error=True)
 
+class UserSnapshot(NamedTuple):
+    """Detached, read-only view of the user fields needed for permission checks"""
+    id: int
+    firebase_uid: str
+    email: str
+    name: str
+    role: RoleEnum
+    role_level: int
+
+# role_level of an existing row, derived from its stored role
+_ROLE_LEVEL_FROM_ROLE = case({role: role.level for role in RoleEnum}, value=User.role, else_=RoleEnum.DEACON.level)
+
+# Recently authenticated users keyed by Firebase UID, so warm users skip the database.
+# The cache is per worker process: invalidate_cached_user only clears the calling worker, so
+# after a role change other workers keep serving the old role for up to USER_CACHE_TTL_SECONDS.
+USER_CACHE_TTL_SECONDS = 30
+_USER_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=USER_CACHE_TTL_SECONDS)
+_USER_CACHE_LOCK = threading.RLock()
+
+def invalidate_cached_user(firebase_uid: str) -> None:
+    """Drop this worker's cached snapshot of a user, e.g. after their role changes"""
+    with _USER_CACHE_LOCK:
+        _USER_CACHE.pop(firebase_uid, None)
+
 async def verify_firebase_token(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
     """
     Verify Firebase JWT token and return decoded user data
@@ -49,8 +84,13 @@ async def verify_firebase_token(credentials: HTTPAuthorizationCredentials = Depe
     try:
         token = credentials.credentials
         
-        # Verify the Firebase ID token
-        decoded_token = auth.verify_id_token(token)
+        # Reuse claims verified moments ago for the same token
+        cached_claims = get_cached_claims(token)
+        if cached_claims is not None:
+            return cached_claims
+        
+        # Verify the Firebase ID token locally, batched with other in-flight requests
+        decoded_token = await jwt_batcher.verify_id_token(token)
         
         # Validate required fields
         if not decoded_token.get("uid"):
@@ -60,33 +100,19 @@ async def verify_firebase_token(credentials: HTTPAuthorizationCredentials = Depe
                 headers={"WWW-Authenticate": "Bearer"},
             )
         
-        # Check token expiration
-        exp = decoded_token.get("exp")
-        if exp and datetime.fromtimestamp(exp) < datetime.utcnow():
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Token expired",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-        
-        logger.info(f"Token verified for user: {decoded_token.get('uid')}")
+        # Expiration is enforced by jwt.decode (ExpiredSignatureError below)
+        logger.debug("Token verified for user: %s", decoded_token["uid"])
+        cache_claims(token, decoded_token)
         return decoded_token
         
-    except auth.ExpiredIdTokenError:
+    except jwt.ExpiredSignatureError:
         logger.warning("Expired Firebase token detected")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token expired",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    except auth.RevokedIdTokenError:
-        logger.warning("Revoked Firebase token detected")
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Token revoked",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    except auth.InvalidIdTokenError:
+    except jwt.InvalidTokenError:
         logger.warning("Invalid Firebase token detected")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -94,7 +120,7 @@ async def verify_firebase_token(credentials: HTTPAuthorizationCredentials = Depe
             headers={"WWW-Authenticate": "Bearer"},
         )
     except Exception as e:
-        logger.error(f"Token verification error: {e}")
+        logger.error("Token verification error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Authentication failed",
@@ -103,8 +129,8 @@ async def verify_firebase_token(credentials: HTTPAuthorizationCredentials = Depe
 
 async def get_current_user(
     token_data: dict = Depends(verify_firebase_token),
-    db: Session = Depends(get_db)
-) -> User:
+    db: AsyncSession = Depends(get_async_db)
+) -> UserSnapshot:
     """
     Get or create current user from database based on Firebase UID
     Handles user creation for new Firebase users
@@ -117,32 +143,50 @@ async def get_current_user(
                 detail="Invalid token data: missing UID"
             )
         
-        # Check if user exists in database
-        user = db.query(User).filter(User.firebase_uid == firebase_uid).first()
+        email = token_data.get("email", "")
+        
+        with _USER_CACHE_LOCK:
+            cached_user = _USER_CACHE.get(firebase_uid)
+        if cached_user is not None and cached_user.email == email:
+            return cached_user
         
-        if not user:
-            # Create new user with default role
-            user = User(
+        name = token_data.get("name", token_data.get("display_name", "Unknown User"))
+        
+        # PostgreSQL leaves xmax at 0 on freshly inserted rows; SQLite can't tell, so there
+        # every upsert counts as a sign-up
+        inserted = literal_column("xmax = 0") if db.bind.dialect.name == "postgresql" else true()
+        
+        # Get or create the user in one round trip, refreshing the email of existing users
+        # and re-deriving role_level from role so it can't drift from it
+        stmt = (
+            dialect_insert(User)
+            .values(
                 firebase_uid=firebase_uid,
-                email=token_data.get("email", ""),
-                name=token_data.get("name", token_data.get("display_name", "Unknown User")),
-                role=RoleEnum.DEACON  # Default role for new users
+                email=email,
+                name=name,
+                role=RoleEnum.DEACON,  # Default role for new users
+                role_level=RoleEnum.DEACON.level
             )
-            db.add(user)
-            db.commit()
-            db.refresh(user)
-            logger.info(f"Created new user: {user.name} (UID: {firebase_uid})")
-        else:
-            # Update user information if needed
-            if user.email != token_data.get("email", ""):
-                user.email = token_data.get("email", "")
-                db.commit()
-                logger.info(f"Updated user email: {user.name}")
+            .on_conflict_do_update(
+                index_elements=["firebase_uid"],
+                set_={"email": email, "role_level": _ROLE_LEVEL_FROM_ROLE}
+            )
+            # Only the columns permission checks need, in UserSnapshot field order
+            .returning(User.id, User.firebase_uid, User.email, User.name, User.role, User.role_level, inserted)
+        )
+        *fields, was_inserted = (await db.execute(stmt)).one()
+        snapshot = UserSnapshot(*fields)
+        await db.commit()
+        if was_inserted:
+            # A new Deacon changes the dashboard's role totals
+            invalidate_role_counts()
         
-        return user
+        with _USER_CACHE_LOCK:
+            _USER_CACHE[firebase_uid] = snapshot
+        return snapshot
         
     except Exception as e:
-        logger.error(f"Error getting current user: {e}")
+        logger.error("Error getting current user: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve user data"
@@ -153,30 +197,23 @@ def check_role_permission(user: User, required_role: RoleEnum) -> bool:
     Check if user has required role permission using EXOUSIA hierarchy
     Returns True if user's role level >= required role level
     """
-    role_hierarchy = {
-        RoleEnum.DEACON: 1,
-        RoleEnum.ELDER: 2,
-        RoleEnum.APOSTLE: 3,
-        RoleEnum.NATION_SEER: 4
-    }
+    has_permission = user.role_level >= required_role.level
     
-    user_level = role_hierarchy.get(user.role, 0)
-    required_level = role_hierarchy.get(required_role, 0)
-    
-    has_permission = user_level >= required_level
-    
-    logger.info(f"Role check: {user.name} ({user.role.value}) -> {required_role.value} = {has_permission}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Role check: %s (%s) -> %s = %s", user.name, user.role.value, required_role.value, has_permission)
     
     return has_permission
 
+@lru_cache(maxsize=None)
 def require_role(required_role: RoleEnum):
     """
     Async route guard decorator to require specific EXOUSIA role
     Usage: @app.get("/admin") @require_role(RoleEnum.APOSTLE)
     """
-    def role_checker(current_user: User = Depends(get_current_user)):
+    def role_checker(current_user: UserSnapshot = Depends(get_current_user)):
         if not check_role_permission(current_user, required_role):
-            logger.warning(f"Access denied: {current_user.name} tried to access {required_role.value} endpoint")
+            invalidate_cached_user(current_user.firebase_uid)
+            logger.warning("Access denied: %s tried to access %s endpoint", current_user.name, required_role.value)
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Insufficient permissions. Required role: {required_role.value}. Your role: {current_user.role.value}"
@@ -184,14 +221,16 @@ def require_role(required_role: RoleEnum):
         return current_user
     return role_checker
 
+@lru_cache(maxsize=None)
 def require_minimum_role(minimum_role: RoleEnum):
     """
     Async route guard for minimum role requirement
     Allows access if user has minimum role or higher
     """
-    def role_checker(current_user: User = Depends(get_current_user)):
+    def role_checker(current_user: UserSnapshot = Depends(get_current_user)):
         if not check_role_permission(current_user, minimum_role):
-            logger.warning(f"Access denied: {current_user.name} tried to access minimum {minimum_role.value} endpoint")
+            invalidate_cached_user(current_user.firebase_uid)
+            logger.warning("Access denied: %s tried to access minimum %s endpoint", current_user.name, minimum_role.value)
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Insufficient permissions. Minimum required role: {minimum_role.value}. Your role: {current_user.role.value}"
@@ -199,64 +238,54 @@ def require_minimum_role(minimum_role: RoleEnum):
         return current_user
     return role_checker
 
-async def get_user_permissions(user: User) -> list:
+# Permission sets per EXOUSIA role, built once at import
+_PERMISSIONS: Mapping[RoleEnum, Tuple[str, ...]] = MappingProxyType({
+    RoleEnum.DEACON: (
+        "view_prophecies",
+        "create_basic_prophecies",
+        "join_prayer_sessions"
+    ),
+    RoleEnum.ELDER: (
+        "view_prophecies",
+        "create_prophecies",
+        "manage_prayer_sessions",
+        "access_bible_characters",
+        "view_holy_land"
+    ),
+    RoleEnum.APOSTLE: (
+        "view_prophecies",
+        "create_prophecies",
+        "manage_prayer_sessions",
+        "access_bible_characters",
+        "view_holy_land",
+        "create_scroll_compositions",
+        "manage_users",
+        "start_livestreams"
+    ),
+    RoleEnum.NATION_SEER: (
+        "view_prophecies",
+        "create_prophecies",
+        "manage_prayer_sessions",
+        "access_bible_characters",
+        "view_holy_land",
+        "create_scroll_compositions",
+        "manage_users",
+        "start_livestreams",
+        "manage_roles",
+        "access_all_modules",
+        "prophetic_oversight"
+    )
+})
+
+def get_user_permissions(user: User) -> Tuple[str, ...]:
     """
     Get user's permissions based on their EXOUSIA role
-    Returns list of permission strings
+    Returns tuple of permission strings
     """
-    permissions_map = {
-        RoleEnum.DEACON: [
-            "view_prophecies",
-            "create_basic_prophecies",
-            "join_prayer_sessions"
-        ],
-        RoleEnum.ELDER: [
-            "view_prophecies",
-            "create_prophecies",
-            "manage_prayer_sessions",
-            "access_bible_characters",
-            "view_holy_land"
-        ],
-        RoleEnum.APOSTLE: [
-            "view_prophecies",
-            "create_prophecies",
-            "manage_prayer_sessions",
-            "access_bible_characters",
-            "view_holy_land",
-            "create_scroll_compositions",
-            "manage_users",
-            "start_livestreams"
-        ],
-        RoleEnum.NATION_SEER: [
-            "view_prophecies",
-            "create_prophecies",
-            "manage_prayer_sessions",
-            "access_bible_characters",
-            "view_holy_land",
-            "create_scroll_compositions",
-            "manage_users",
-            "start_livestreams",
-            "manage_roles",
-            "access_all_modules",
-            "prophetic_oversight"
-        ]
-    }
-    
-    return permissions_map.get(user.role, [])
-
-# Convenience functions for common role checks
-def require_deacon():
-    """Require at least Deacon role"""
-    return require_minimum_role(RoleEnum.DEACON)
-
-def require_elder():
-    """Require at least Elder role"""
-    return require_minimum_role(RoleEnum.ELDER)
-
-def require_apostle():
-    """Require at least Apostle role"""
-    return require_minimum_role(RoleEnum.APOSTLE)
+    return _PERMISSIONS.get(user.role, ())
 
-def require_nation_seer():
-    """Require Nation Seer role (highest level)"""
-    return require_role(RoleEnum.NATION_SEER) 
\ No newline at end of file
+# Convenience dependencies for common role checks
+require_deacon = require_minimum_role(RoleEnum.DEACON)  # At least Deacon role
+require_elder = require_minimum_role(RoleEnum.ELDER)  # At least Elder role
+require_apostle = require_minimum_role(RoleEnum.APOSTLE)  # At least Apostle role
+require_nation_seer = require_role(RoleEnum.NATION_SEER)  # Nation Seer role (highest level)
@@ -0,0 +1,55 @@
+from typing import Optional, Union
+import logging
+import redis.asyncio as redis
+from cachetools import TTLCache
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+_client: Optional[redis.Redis] = None
+
+# Role totals change only on sign-up or role assignment; each worker keeps them briefly.
+# Invalidation only clears the calling worker's copy, other workers catch up within the TTL.
+ROLE_COUNTS_TTL_SECONDS = 60
+ROLE_COUNTS_KEY = "role_counts"
+role_counts_cache: TTLCache = TTLCache(maxsize=1, ttl=ROLE_COUNTS_TTL_SECONDS)
+
+def invalidate_role_counts() -> None:
+    """Drop this worker's cached role totals, e.g. after a role change"""
+    role_counts_cache.pop(ROLE_COUNTS_KEY, None)
+
+def get_redis() -> Optional[redis.Redis]:
+    """Get the shared async Redis client, or None when REDIS_URL is not configured"""
+    global _client
+    if _client is None and settings.redis_url:
+        _client = redis.Redis.from_url(settings.redis_url, password=settings.redis_password)
+    return _client
+
+async def close_redis() -> None:
+    """Close the shared Redis client if one was created"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+async def get_cached(key: str) -> Optional[bytes]:
+    """Read a cached value; an unconfigured or unavailable Redis counts as a miss"""
+    client = get_redis()
+    if client is None:
+        return None
+    try:
+        return await client.get(key)
+    except Exception as e:
+        logger.warning("Redis read failed for %s: %s", key, e)
+        return None
+
+async def set_cached(key: str, value: Union[bytes, str], ttl_seconds: int) -> None:
+    """Store a value with a TTL; failures are logged and otherwise ignored"""
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        await client.setex(key, ttl_seconds, value)
+    except Exception as e:
+        logger.warning("Redis write failed for %s: %s", key, e)
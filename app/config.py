@@ -1,6 +1,8 @@
 import os
-from typing import List, Optional
-from pydantic import BaseSettings, Field
+from functools import lru_cache
+from typing import Annotated, Optional, Tuple
+from pydantic import Field, field_validator
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -12,125 +14,136 @@ class Settings(BaseSettings):
     # =============================================================================
     # FIREBASE CONFIGURATION
     # =============================================================================
-    firebase_project_id: str = Field(..., env="FIREBASE_PROJECT_ID")
-    firebase_private_key_id: str = Field(..., env="FIREBASE_PRIVATE_KEY_ID")
-    firebase_private_key: str = Field(..., env="FIREBASE_PRIVATE_KEY")
-    firebase_client_email: str = Field(..., env="FIREBASE_CLIENT_EMAIL")
-    firebase_client_id: str = Field(..., env="FIREBASE_CLIENT_ID")
-    firebase_auth_uri: str = Field(default="https://accounts.google.com/o/oauth2/auth", env="FIREBASE_AUTH_URI")
-    firebase_token_uri: str = Field(default="https://oauth2.googleapis.com/token", env="FIREBASE_TOKEN_URI")
-    firebase_auth_provider_x509_cert_url: str = Field(default="https://www.googleapis.com/oauth2/v1/certs", env="FIREBASE_AUTH_PROVIDER_X509_CERT_URL")
-    firebase_client_x509_cert_url: str = Field(..., env="FIREBASE_CLIENT_X509_CERT_URL")
+    firebase_project_id: str = Field(...)
+    firebase_private_key_id: str = Field(...)
+    firebase_private_key: str = Field(...)
+    firebase_client_email: str = Field(...)
+    firebase_client_id: str = Field(...)
+    firebase_auth_uri: str = Field(default="https://accounts.google.com/o/oauth2/auth")
+    firebase_token_uri: str = Field(default="https://oauth2.googleapis.com/token")
+    firebase_auth_provider_x509_cert_url: str = Field(default="https://www.googleapis.com/oauth2/v1/certs")
+    firebase_client_x509_cert_url: str = Field(...)
     
     # =============================================================================
     # OPENAI CONFIGURATION
     # =============================================================================
-    openai_api_key: str = Field(..., env="OPENAI_API_KEY")
+    openai_api_key: str = Field(...)
     
     # =============================================================================
     # DATABASE CONFIGURATION
     # =============================================================================
-    database_url: str = Field(..., env="DATABASE_URL")
-    database_test_url: Optional[str] = Field(None, env="DATABASE_TEST_URL")
+    database_url: str = Field(...)
+    database_test_url: Optional[str] = Field(None)
     
     # =============================================================================
     # JWT CONFIGURATION
     # =============================================================================
-    jwt_secret_key: str = Field(..., env="JWT_SECRET_KEY")
-    jwt_algorithm: str = Field(default="HS256", env="JWT_ALGORITHM")
-    jwt_expiration_seconds: int = Field(default=86400, env="JWT_EXPIRATION_SECONDS")
+    jwt_secret_key: str = Field(...)
+    jwt_algorithm: str = Field(default="HS256")
+    jwt_expiration_seconds: int = Field(default=86400)
     
     # =============================================================================
     # STRIPE CONFIGURATION
     # =============================================================================
-    stripe_secret_key: str = Field(..., env="STRIPE_SECRET_KEY")
-    stripe_publishable_key: str = Field(..., env="STRIPE_PUBLISHABLE_KEY")
-    stripe_webhook_secret: str = Field(..., env="STRIPE_WEBHOOK_SECRET")
+    stripe_secret_key: str = Field(...)
+    stripe_publishable_key: str = Field(...)
+    stripe_webhook_secret: str = Field(...)
     
     # =============================================================================
     # SERVER CONFIGURATION
     # =============================================================================
-    host: str = Field(default="0.0.0.0", env="HOST")
-    port: int = Field(default=8000, env="PORT")
-    debug: bool = Field(default=False, env="DEBUG")
-    environment: str = Field(default="production", env="ENVIRONMENT")
+    host: str = Field(default="0.0.0.0")
+    port: int = Field(default=8000)
+    debug: bool = Field(default=False)
+    environment: str = Field(default="production")
     
     # =============================================================================
     # CORS CONFIGURATION
     # =============================================================================
-    allowed_origins: List[str] = Field(
-        default=[
+    allowed_origins: Annotated[Tuple[str, ...], NoDecode] = Field(
+        default=(
             "http://localhost:3000",
+            "http://127.0.0.1:3000",
             "http://localhost:5173",
             "https://churchos.app",
             "https://www.churchos.app"
-        ],
-        env="ALLOWED_ORIGINS"
+        )
     )
     
     # =============================================================================
     # LOGGING CONFIGURATION
     # =============================================================================
-    log_level: str = Field(default="INFO", env="LOG_LEVEL")
-    log_file: str = Field(default="logs/churchos.log", env="LOG_FILE")
+    log_level: str = Field(default="INFO")
+    log_file: str = Field(default="logs/churchos.log")
     
     # =============================================================================
     # REDIS CONFIGURATION
     # =============================================================================
-    redis_url: Optional[str] = Field(None, env="REDIS_URL")
-    redis_password: Optional[str] = Field(None, env="REDIS_PASSWORD")
+    redis_url: Optional[str] = Field(None)
+    redis_password: Optional[str] = Field(None)
     
     # =============================================================================
     # EMAIL CONFIGURATION
     # =============================================================================
-    smtp_host: Optional[str] = Field(None, env="SMTP_HOST")
-    smtp_port: int = Field(default=587, env="SMTP_PORT")
-    smtp_user: Optional[str] = Field(None, env="SMTP_USER")
-    smtp_password: Optional[str] = Field(None, env="SMTP_PASSWORD")
+    smtp_host: Optional[str] = Field(None)
+    smtp_port: int = Field(default=587)
+    smtp_user: Optional[str] = Field(None)
+    smtp_password: Optional[str] = Field(None)
     
     # =============================================================================
     # FILE STORAGE CONFIGURATION
     # =============================================================================
-    aws_access_key_id: Optional[str] = Field(None, env="AWS_ACCESS_KEY_ID")
-    aws_secret_access_key: Optional[str] = Field(None, env="AWS_SECRET_ACCESS_KEY")
-    aws_region: str = Field(default="us-east-1", env="AWS_REGION")
-    aws_s3_bucket: Optional[str] = Field(None, env="AWS_S3_BUCKET")
+    aws_access_key_id: Optional[str] = Field(None)
+    aws_secret_access_key: Optional[str] = Field(None)
+    aws_region: str = Field(default="us-east-1")
+    aws_s3_bucket: Optional[str] = Field(None)
     
     # =============================================================================
     # ANALYTICS CONFIGURATION
     # =============================================================================
-    google_analytics_id: Optional[str] = Field(None, env="GOOGLE_ANALYTICS_ID")
-    mixpanel_token: Optional[str] = Field(None, env="MIXPANEL_TOKEN")
+    google_analytics_id: Optional[str] = Field(None)
+    mixpanel_token: Optional[str] = Field(None)
     
     # =============================================================================
     # SECURITY CONFIGURATION
     # =============================================================================
-    secret_key: str = Field(..., env="SECRET_KEY")
-    allowed_hosts: List[str] = Field(
-        default=["localhost", "127.0.0.1", "churchos.app", "www.churchos.app"],
-        env="ALLOWED_HOSTS"
+    secret_key: str = Field(...)
+    allowed_hosts: Annotated[Tuple[str, ...], NoDecode] = Field(
+        default=("localhost", "127.0.0.1", "churchos.app", "www.churchos.app")
     )
     
     # =============================================================================
     # FEATURE FLAGS
     # =============================================================================
-    enable_ai_characters: bool = Field(default=True, env="ENABLE_AI_CHARACTERS")
-    enable_livestreaming: bool = Field(default=True, env="ENABLE_LIVESTREAMING")
-    enable_xr_holyland: bool = Field(default=True, env="ENABLE_XR_HOLYLAND")
-    enable_mobile_control: bool = Field(default=True, env="ENABLE_MOBILE_CONTROL")
-    enable_analytics: bool = Field(default=True, env="ENABLE_ANALYTICS")
-    enable_billing: bool = Field(default=True, env="ENABLE_BILLING")
-    
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
+    enable_ai_characters: bool = Field(default=True)
+    enable_livestreaming: bool = Field(default=True)
+    enable_xr_holyland: bool = Field(default=True)
+    enable_mobile_control: bool = Field(default=True)
+    enable_analytics: bool = Field(default=True)
+    enable_billing: bool = Field(default=True)
+    
+    @field_validator("allowed_origins", "allowed_hosts", mode="before")
+    @classmethod
+    def split_comma_separated(cls, value):
+        """Accept comma-separated strings from the environment, normalized once at load"""
+        if isinstance(value, str):
+            return tuple(item.strip() for item in value.split(",") if item.strip())
+        return tuple(value)
+    
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
+        frozen=True
+    )
 
 # Create global settings instance
 settings = Settings()
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get the global settings instance"""
+    """Get the global settings instance (read once, immutable)"""
     return settings
 
 def get_firebase_config() -> dict:
@@ -162,14 +175,10 @@ def is_development() -> bool:
     """Check if running in development environment"""
     return settings.environment.lower() == "development"
 
-def get_cors_origins() -> List[str]:
-    """Get CORS origins as a list"""
-    if isinstance(settings.allowed_origins, str):
-        return [origin.strip() for origin in settings.allowed_origins.split(",")]
+def get_cors_origins() -> Tuple[str, ...]:
+    """Get CORS origins (normalized when settings are loaded)"""
     return settings.allowed_origins
 
-def get_allowed_hosts() -> List[str]:
-    """Get allowed hosts as a list"""
-    if isinstance(settings.allowed_hosts, str):
-        return [host.strip() for host in settings.allowed_hosts.split(",")]
-    return settings.allowed_hosts 
\ No newline at end of file
+def get_allowed_hosts() -> Tuple[str, ...]:
+    """Get allowed hosts (normalized when settings are loaded)"""
+    return settings.allowed_hosts
\ No newline at end of file
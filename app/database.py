@@ -1,7 +1,10 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool, StaticPool
 import os
 from dotenv import load_dotenv
 
@@ -13,6 +16,10 @@ DATABASE_URL = os.getenv(
     "sqlite:///./churchos.db"
 )
 
+# Compiled-statement cache entries per engine; roomy enough that the per-endpoint
+# statement variants (filters, limits, eager loads) are never evicted
+QUERY_CACHE_SIZE = 1200
+
 # Create engine
 if DATABASE_URL.startswith("sqlite"):
     engine = create_engine(
@@ -21,10 +28,48 @@ if DATABASE_URL.startswith("sqlite"):
         poolclass=StaticPool,
     )
 else:
-    engine = create_engine(DATABASE_URL)
+    # Sized for concurrent dashboard requests; pre_ping drops dead connections before use
+    engine = create_engine(
+        DATABASE_URL,
+        pool_size=20,
+        max_overflow=40,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        query_cache_size=QUERY_CACHE_SIZE,
+    )
+
+# Async engine on the same database for handlers that must not block the event loop.
+# The driver is picked per backend, so e.g. a postgresql+psycopg2 URL still maps to asyncpg.
+ASYNC_DRIVERS = {"postgresql": "postgresql+asyncpg", "sqlite": "sqlite+aiosqlite"}
+_url = make_url(DATABASE_URL)
+ASYNC_DATABASE_URL = _url.set(drivername=ASYNC_DRIVERS.get(_url.get_backend_name(), _url.drivername))
+
+if DATABASE_URL.startswith("sqlite"):
+    # Dashboards fan queries out over separate sessions, so each needs its own connection;
+    # only an in-memory database has to share a single one to stay visible
+    in_memory = _url.database in (None, "", ":memory:")
+    async_engine = create_async_engine(
+        ASYNC_DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool if in_memory else NullPool,
+    )
+else:
+    # Dashboards fan several queries out at once per request, so allow generous overflow
+    async_engine = create_async_engine(
+        ASYNC_DATABASE_URL,
+        pool_size=20,
+        max_overflow=40,
+        pool_pre_ping=True,
+        pool_recycle=3600,
+        query_cache_size=QUERY_CACHE_SIZE,
+    )
+
+# Dialect-specific INSERT construct (supports ON CONFLICT ... and RETURNING)
+dialect_insert = sqlite.insert if DATABASE_URL.startswith("sqlite") else postgresql.insert
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
 
 # Create Base class
 Base = declarative_base()
@@ -35,4 +80,9 @@ def get_db():
     try:
         yield db
     finally:
-        db.close() 
\ No newline at end of file
+        db.close()
+
+# Dependency to get an async database session
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
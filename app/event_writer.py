@@ -0,0 +1,104 @@
+import asyncio
+import json
+import logging
+import uuid
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import insert
+
+from .database import AsyncSessionLocal
+from .models import ActivityEvent
+
+logger = logging.getLogger(__name__)
+
+# Buffered events are written together at most this often, amortizing one commit over a burst
+FLUSH_INTERVAL_SECONDS = 0.2
+FLUSH_MAX_ROWS = 500
+
+# A failed batch is retried this many more times, after a short pause, before it is dropped
+FLUSH_RETRIES = 1
+FLUSH_RETRY_DELAY_SECONDS = 1.0
+
+_queue: Optional[asyncio.Queue] = None
+_worker: Optional[asyncio.Task] = None
+
+async def _flush(rows: List[Dict[str, Any]]) -> None:
+    """Insert buffered events in a single executemany and commit, retrying a failed batch"""
+    for attempt in range(FLUSH_RETRIES + 1):
+        try:
+            async with AsyncSessionLocal() as session:
+                await session.execute(insert(ActivityEvent), rows)
+                await session.commit()
+            return
+        except Exception as e:
+            if attempt == FLUSH_RETRIES:
+                logger.error("Failed to write %d activity events: %s", len(rows), e)
+                return
+            logger.warning("Retrying write of %d activity events: %s", len(rows), e)
+            await asyncio.sleep(FLUSH_RETRY_DELAY_SECONDS)
+
+def _drain(limit: int) -> List[Dict[str, Any]]:
+    """Take up to limit queued rows without waiting"""
+    rows = []
+    while len(rows) < limit:
+        try:
+            rows.append(_queue.get_nowait())
+        except asyncio.QueueEmpty:
+            break
+    return rows
+
+async def _run_flushes() -> None:
+    """Wait for the first event, collect the rest of the window, then write them together"""
+    rows: List[Dict[str, Any]] = []
+    flushing: Optional[asyncio.Task] = None
+    try:
+        while True:
+            rows = [await _queue.get()]
+            await asyncio.sleep(FLUSH_INTERVAL_SECONDS)
+            rows.extend(_drain(FLUSH_MAX_ROWS - 1))
+            flushing = asyncio.create_task(_flush(rows))
+            rows = []
+            # Shielded so stop() can't cut a write off halfway
+            await asyncio.shield(flushing)
+            flushing = None
+    finally:
+        # Dequeued rows live only in this frame; finish writing them before the task exits
+        if flushing is not None:
+            await flushing
+        if rows:
+            await _flush(rows)
+
+def start() -> None:
+    """Start the background flush task on the running event loop"""
+    global _queue, _worker
+    if _worker is None or _worker.done():
+        _queue = asyncio.Queue()
+        _worker = asyncio.create_task(_run_flushes())
+
+async def stop() -> None:
+    """Cancel the flush task and write whatever is still buffered"""
+    global _worker
+    if _worker is not None:
+        _worker.cancel()
+        try:
+            await _worker
+        except asyncio.CancelledError:
+            pass
+        _worker = None
+    while _queue is not None and not _queue.empty():
+        await _flush(_drain(FLUSH_MAX_ROWS))
+
+def record(kind: str, user_id: Optional[int], payload: Dict[str, Any]) -> str:
+    """
+    Queue an activity event for the next batched insert and return its id
+    The write happens asynchronously, trading strict durability for throughput
+    """
+    start()
+    event_id = str(uuid.uuid4())
+    _queue.put_nowait({
+        "id": event_id,
+        "kind": kind,
+        "user_id": user_id,
+        "payload": json.dumps(payload, default=str)
+    })
+    return event_id
@@ -0,0 +1,212 @@
+import asyncio
+import json
+import logging
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+import jwt
+import requests
+from cryptography import x509
+from fastapi.concurrency import run_in_threadpool
+
+from .cache import get_redis
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+# Google's x509 certificates for the keys that sign Firebase ID tokens, keyed by kid
+FIREBASE_CERTS_URL = "https://www.googleapis.com/robot/v1/metadata/x509/securetoken@system.gserviceaccount.com"
+
+# Shared copy of the certificates so workers don't each fetch them from Google
+JWKS_REDIS_KEY = "fb:jwks"
+JWKS_REDIS_TTL_SECONDS = 3600
+
+# Unknown kids trigger a refresh at most this often, so forged headers can't force fetches
+KEY_REFRESH_MIN_INTERVAL_SECONDS = 30
+
+# After a failed load, retry this soon instead of rejecting every token for the full interval
+KEY_REFRESH_RETRY_SECONDS = 2
+
+# Firebase ID tokens are issued for, and by, the configured project
+TOKEN_AUDIENCE = settings.firebase_project_id
+TOKEN_ISSUER = f"https://securetoken.google.com/{settings.firebase_project_id}"
+
+# Collect up to this many pending tokens, or wait at most this long, before verifying
+BATCH_MAX_SIZE = 32
+BATCH_WINDOW_SECONDS = 0.001
+
+_public_keys: Dict[str, object] = {}
+_refresh_not_before = 0.0
+_queue: Optional[asyncio.Queue] = None
+_worker: Optional[asyncio.Task] = None
+_batches: Set[asyncio.Task] = set()
+_refresh_lock = asyncio.Lock()
+
+def _fetch_certificates() -> Dict[str, str]:
+    """Fetch Google's current signing certificates (PEM) keyed by kid"""
+    response = requests.get(FIREBASE_CERTS_URL, timeout=10)
+    response.raise_for_status()
+    return response.json()
+
+async def _load_certificates(required_kids) -> Dict[str, str]:
+    """
+    Read certificates from the shared Redis copy when it has every required kid,
+    otherwise fetch them from Google and refresh the Redis copy
+    """
+    redis = get_redis()
+    certs = None
+    if redis is not None:
+        try:
+            cached = await redis.get(JWKS_REDIS_KEY)
+            if cached:
+                certs = json.loads(cached)
+        except Exception as e:
+            logger.warning("Failed to read Firebase signing keys from Redis: %s", e)
+
+    if certs is None or any(kid not in certs for kid in required_kids):
+        certs = await run_in_threadpool(_fetch_certificates)
+        if redis is not None:
+            try:
+                await redis.setex(JWKS_REDIS_KEY, JWKS_REDIS_TTL_SECONDS, json.dumps(certs))
+            except Exception as e:
+                logger.warning("Failed to store Firebase signing keys in Redis: %s", e)
+    return certs
+
+async def load_public_keys(required_kids=()) -> None:
+    """
+    Load signing keys, from Redis or Google, and throttle the next refresh
+    A failed load only backs off briefly, so an empty key set is retried soon
+    """
+    global _public_keys, _refresh_not_before
+    try:
+        certs = await _load_certificates(required_kids)
+        public_keys = {
+            kid: x509.load_pem_x509_certificate(pem.encode()).public_key()
+            for kid, pem in certs.items()
+        }
+    except Exception:
+        _refresh_not_before = time.monotonic() + KEY_REFRESH_RETRY_SECONDS
+        raise
+
+    _public_keys = public_keys
+    _refresh_not_before = time.monotonic() + KEY_REFRESH_MIN_INTERVAL_SECONDS
+    logger.info("Loaded %d Firebase signing keys", len(_public_keys))
+
+def _unverified_kid(token: str) -> Optional[str]:
+    """Read the signing key id from the token header without verifying it"""
+    try:
+        return jwt.get_unverified_header(token).get("kid")
+    except jwt.InvalidTokenError:
+        return None
+
+def _decode(token: str, key) -> dict:
+    """Verify signature and standard Firebase ID token claims"""
+    claims = jwt.decode(
+        token,
+        key,
+        algorithms=["RS256"],
+        audience=TOKEN_AUDIENCE,
+        issuer=TOKEN_ISSUER,
+        options={"require": ["exp", "iat", "sub"]}
+    )
+    claims["uid"] = claims["sub"]
+    return claims
+
+def _verify_batch(tokens: List[str]) -> List[Tuple[Optional[dict], Optional[Exception]]]:
+    """Verify a batch of tokens, grouped by signing key, returning (claims, error) pairs"""
+    results: List[Tuple[Optional[dict], Optional[Exception]]] = [(None, None)] * len(tokens)
+    by_kid: Dict[str, List[int]] = {}
+    for index, token in enumerate(tokens):
+        try:
+            kid = jwt.get_unverified_header(token).get("kid")
+        except jwt.InvalidTokenError as e:
+            results[index] = (None, e)
+            continue
+        by_kid.setdefault(kid, []).append(index)
+
+    for kid, indexes in by_kid.items():
+        key = _public_keys.get(kid)
+        for index in indexes:
+            if key is None:
+                results[index] = (None, jwt.InvalidTokenError(f"Unknown signing key: {kid}"))
+                continue
+            try:
+                results[index] = (_decode(tokens[index], key), None)
+            except jwt.InvalidTokenError as e:
+                results[index] = (None, e)
+    return results
+
+async def _refresh_keys_for(tokens: List[str]) -> None:
+    """Refresh signing keys when tokens name a kid we don't have, one refresh at a time"""
+    async with _refresh_lock:
+        unknown_kids = {_unverified_kid(token) for token in tokens} - set(_public_keys) - {None}
+        if unknown_kids and time.monotonic() >= _refresh_not_before:
+            try:
+                await load_public_keys(unknown_kids)
+            except Exception as e:
+                logger.error("Failed to refresh Firebase signing keys: %s", e)
+
+async def _process_batch(batch: List[Tuple[str, asyncio.Future]]) -> None:
+    """Verify one batch in the threadpool and resolve each caller's future"""
+    tokens = [token for token, _ in batch]
+    await _refresh_keys_for(tokens)
+
+    try:
+        results = await run_in_threadpool(_verify_batch, tokens)
+    except Exception as e:
+        results = [(None, e)] * len(batch)
+
+    for (_, future), (claims, error) in zip(batch, results):
+        if future.done():
+            continue
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(claims)
+
+async def _run_batches() -> None:
+    """Drain the queue in small batches, verifying each batch concurrently as its own task"""
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await _queue.get()]
+        deadline = loop.time() + BATCH_WINDOW_SECONDS
+        while len(batch) < BATCH_MAX_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(_queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        task = asyncio.create_task(_process_batch(batch))
+        _batches.add(task)
+        task.add_done_callback(_batches.discard)
+
+def start() -> None:
+    """Start the background batching task on the running event loop"""
+    global _queue, _worker
+    if _worker is None or _worker.done():
+        _queue = asyncio.Queue()
+        _worker = asyncio.create_task(_run_batches())
+
+async def stop() -> None:
+    """Cancel the background batching task and any batches still being verified"""
+    global _worker
+    tasks = list(_batches)
+    if _worker is not None:
+        tasks.append(_worker)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    _worker = None
+
+async def verify_id_token(token: str) -> dict:
+    """
+    Verify a Firebase ID token and return its decoded claims
+    Raises jwt.ExpiredSignatureError / jwt.InvalidTokenError on failure
+    """
+    start()
+    future = asyncio.get_running_loop().create_future()
+    await _queue.put((token, future))
+    return await future
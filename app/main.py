@@ -1,106 +1,102 @@
-from fastapi import FastAPI, HTTPException, Depends, status
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from fastapi.responses import JSONResponse
-import firebase_admin
-from firebase_admin import credentials, auth
+from fastapi.responses import ORJSONResponse, Response
+import anyio.to_thread
+import orjson
 import os
+import asyncio
+import importlib
+import logging
 from dotenv import load_dotenv
 from contextlib import asynccontextmanager
+from app import event_writer, jwt_batcher, schema_upgrades, smtp_pool, summaries
+from app.cache import close_redis
+from app.config import settings
+from app.auth import initialize_firebase
 
 # Load environment variables
 load_dotenv()
 
-# Initialize Firebase Admin SDK
-try:
-    firebase_admin.get_app()
-except ValueError:
-    # Initialize Firebase Admin SDK with service account
-    if os.getenv("FIREBASE_SERVICE_ACCOUNT_PATH"):
-        cred = credentials.Certificate(os.getenv("FIREBASE_SERVICE_ACCOUNT_PATH"))
-        firebase_admin.initialize_app(cred)
-    else:
-        # Initialize with default credentials (for development)
-        firebase_admin.initialize_app()
+logger = logging.getLogger(__name__)
 
-# Security
-security = HTTPBearer()
+# Routers mounted at startup: (module, prefix, tag)
+ROUTER_MODULES = (
+    ("app.routers.auth", "/api/auth", "Authentication"),
+    ("app.routers.users", "/api/users", "Users"),
+    ("app.routers.prophecies", "/api/prophecies", "Prophecies"),
+    ("app.routers.scroll_cycles", "/api/scroll-cycles", "Scroll Cycles"),
+    ("app.routers.prayer_portal", "/api/prayer-portal", "Prayer Portal"),
+    ("app.routers.bible_character_room", "/api/bible-character-room", "Bible Character Room"),
+    ("app.routers.holy_land_scene", "/api/holy-land-scene", "Holy Land Scene"),
+    ("app.routers.scroll_composer", "/api/scroll-composer", "Scroll Composer"),
+    ("app.routers.scroll_seal", "/api/scroll-seal", "Scroll Seal"),
+    ("app.routers.mobile_control", "/api/mobile-control", "Mobile Control"),
+    ("app.routers.go_live_with_heaven", "/api/go-live-with-heaven", "Go Live With Heaven"),
+    ("app.routers.scroll_license", "/api/scroll-license", "Scroll License"),
+    ("app.routers.analytics", "/api/analytics", "Analytics"),
+)
+
+async def include_routers(app: FastAPI):
+    """Import router modules in parallel worker threads, then mount them"""
+    modules = await asyncio.gather(
+        *(asyncio.to_thread(importlib.import_module, name) for name, _, _ in ROUTER_MODULES)
+    )
+    for module, (_, prefix, tag) in zip(modules, ROUTER_MODULES):
+        app.include_router(module.router, prefix=prefix, tags=[tag])
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
-    print("🕊️ CHURCHOS™ Backend starting up...")
+    logger.info("🕊️ CHURCHOS™ Backend starting up...")
+    initialize_firebase()
+    try:
+        await schema_upgrades.apply()
+    except Exception as e:
+        logger.error("Schema upgrades failed: %s", e)
+    await include_routers(app)
+    # Widen the default threadpool so blocking token verifications can fan out
+    anyio.to_thread.current_default_thread_limiter().total_tokens = 100
+    try:
+        await jwt_batcher.load_public_keys()
+    except Exception as e:
+        logger.warning("Firebase signing keys not preloaded: %s", e)
+    jwt_batcher.start()
+    summaries.start()
+    event_writer.start()
+    # Establish the OpenAI TLS session before the first character chat needs it, without
+    # holding up startup when OpenAI is slow
+    bible_characters = importlib.import_module("app.routers.bible_characters")
+    openai_warmup = asyncio.create_task(bible_characters.warm_openai_client())
     yield
     # Shutdown
-    print("🕊️ CHURCHOS™ Backend shutting down...")
+    openai_warmup.cancel()
+    await asyncio.gather(openai_warmup, return_exceptions=True)
+    await bible_characters.close_openai_client()
+    await event_writer.stop()
+    await summaries.stop()
+    await jwt_batcher.stop()
+    await smtp_pool.close_all()
+    await close_redis()
+    logger.info("🕊️ CHURCHOS™ Backend shutting down...")
 
 # Create FastAPI app
 app = FastAPI(
     title="CHURCHOS™ API",
     description="Sacred Operating System for Prophetic Church Governance",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "http://localhost:3000",
-        "http://127.0.0.1:3000",
-        "https://churchos.app",
-        "https://www.churchos.app"
-    ],
+    allow_origins=settings.allowed_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-# Import routers
-from app.routers import (
-    auth,
-    users,
-    prophecies,
-    scroll_cycles,
-    prayer_portal,
-    bible_character_room,
-    holy_land_scene,
-    scroll_composer,
-    scroll_seal,
-    mobile_control,
-    go_live_with_heaven,
-    scroll_license,
-    analytics
-)
-
-# Include routers
-app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
-app.include_router(users.router, prefix="/api/users", tags=["Users"])
-app.include_router(prophecies.router, prefix="/api/prophecies", tags=["Prophecies"])
-app.include_router(scroll_cycles.router, prefix="/api/scroll-cycles", tags=["Scroll Cycles"])
-app.include_router(prayer_portal.router, prefix="/api/prayer-portal", tags=["Prayer Portal"])
-app.include_router(bible_character_room.router, prefix="/api/bible-character-room", tags=["Bible Character Room"])
-app.include_router(holy_land_scene.router, prefix="/api/holy-land-scene", tags=["Holy Land Scene"])
-app.include_router(scroll_composer.router, prefix="/api/scroll-composer", tags=["Scroll Composer"])
-app.include_router(scroll_seal.router, prefix="/api/scroll-seal", tags=["Scroll Seal"])
-app.include_router(mobile_control.router, prefix="/api/mobile-control", tags=["Mobile Control"])
-app.include_router(go_live_with_heaven.router, prefix="/api/go-live-with-heaven", tags=["Go Live With Heaven"])
-app.include_router(scroll_license.router, prefix="/api/scroll-license", tags=["Scroll License"])
-app.include_router(analytics.router, prefix="/api/analytics", tags=["Analytics"])
-
-# Authentication dependency
-async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
-    try:
-        # Verify Firebase ID token
-        decoded_token = auth.verify_id_token(credentials.credentials)
-        return decoded_token
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authentication credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
 # Root endpoint
 @app.get("/")
 async def root():
@@ -142,27 +138,35 @@ async def api_info():
     }
 
 # Error handlers
+def _error_body(status_code: int, detail, message: str) -> bytes:
+    return orjson.dumps({
+        "error": detail,
+        "status_code": status_code,
+        "message": message
+    })
+
+# Pre-serialized bodies for the errors hit on every rejected authentication attempt
+_PREBAKED_ERRORS = {
+    (status_code, detail): _error_body(status_code, detail, "Sacred error occurred")
+    for status_code, detail in (
+        (401, "Invalid token"),
+        (401, "Token expired"),
+        (401, "Authentication failed"),
+        (403, "Not authenticated"),
+    )
+}
+_INTERNAL_ERROR = _error_body(500, "Internal server error", "Sacred system error occurred")
+
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request, exc):
-    return JSONResponse(
-        status_code=exc.status_code,
-        content={
-            "error": exc.detail,
-            "status_code": exc.status_code,
-            "message": "Sacred error occurred"
-        }
-    )
+    content = _PREBAKED_ERRORS.get((exc.status_code, exc.detail)) if isinstance(exc.detail, str) else None
+    if content is None:
+        content = _error_body(exc.status_code, exc.detail, "Sacred error occurred")
+    return Response(content=content, status_code=exc.status_code, media_type="application/json")
 
 @app.exception_handler(Exception)
 async def general_exception_handler(request, exc):
-    return JSONResponse(
-        status_code=500,
-        content={
-            "error": "Internal server error",
-            "status_code": 500,
-            "message": "Sacred system error occurred"
-        }
-    )
+    return Response(content=_INTERNAL_ERROR, status_code=500, media_type="application/json")
 
 if __name__ == "__main__":
     import uvicorn
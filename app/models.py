@@ -1,16 +1,41 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, ForeignKey, Enum
+from sqlalchemy import Column, Integer, SmallInteger, String, Date, DateTime, Text, Boolean, ForeignKey, Enum, Index, DDL, event
+from sqlalchemy.sql import table, column, text
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
-from datetime import datetime
+from sqlalchemy.orm import relationship, validates
+from pgvector.sqlalchemy import Vector
+from sqlalchemy.sql import func
+from sqlalchemy.sql.expression import FunctionElement
+from sqlalchemy.ext.compiler import compiles
 import enum
 
 Base = declarative_base()
 
+class utcnow(FunctionElement):
+    """Current UTC time for naive DateTime columns, whatever the database session's time zone"""
+    type = DateTime()
+    inherit_cache = True
+
+@compiles(utcnow)
+def _default_utcnow(element, compiler, **kw):
+    # SQLite's CURRENT_TIMESTAMP is already UTC
+    return "CURRENT_TIMESTAMP"
+
+@compiles(utcnow, "postgresql")
+def _pg_utcnow(element, compiler, **kw):
+    return "timezone('utc', now())"
+
 class RoleEnum(enum.Enum):
-    DEACON = "Deacon"
-    ELDER = "Elder"
-    APOSTLE = "Apostle"
-    NATION_SEER = "Nation Seer"
+    """EXOUSIA roles; a higher level inherits the authority of every lower one"""
+    DEACON = ("Deacon", 1)
+    ELDER = ("Elder", 2)
+    APOSTLE = ("Apostle", 3)
+    NATION_SEER = ("Nation Seer", 4)
+
+    def __new__(cls, label: str, level: int):
+        member = object.__new__(cls)
+        member._value_ = label
+        member.level = level
+        return member
 
 class UrgencyEnum(enum.Enum):
     LOW = "low"
@@ -30,26 +55,62 @@ class CycleStatusEnum(enum.Enum):
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        # Lets the per-request auth lookup be answered by an index-only scan
+        Index(
+            "ix_users_firebase_uid_covering",
+            "firebase_uid",
+            postgresql_include=["id", "role", "role_level", "email", "name"]
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String, unique=True, index=True)
-    name = Column(String, index=True)
-    role = Column(Enum(RoleEnum), default=RoleEnum.DEACON)
+    name = Column(String)
+    role = Column(Enum(RoleEnum), default=RoleEnum.DEACON, index=True)
+    role_level = Column(SmallInteger, index=True, nullable=False, default=1)
     firebase_uid = Column(String, unique=True, index=True)
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow())
     
     # Relationships
     prophecies = relationship("Prophecy", back_populates="user")
     scroll_cycles = relationship("ScrollCycle", back_populates="creator")
+    
+    @validates("role")
+    def _sync_role_level(self, key, role):
+        """Keep the indexed role_level in step with role on every assignment"""
+        self.role_level = RoleEnum(role).level
+        return role
+
+# role_level as a SQL expression of the stored role (the enum is stored by member name)
+_ROLE_LEVEL_SQL = "CASE role::text " + " ".join(
+    f"WHEN '{role.name}' THEN {role.level}" for role in RoleEnum
+) + " ELSE 1 END"
+
+# Tables created before role_level and the covering index get them here, at startup via
+# app.schema_upgrades; every statement is idempotent
+USERS_ROLE_LEVEL_DDL = (
+    "ALTER TABLE users ADD COLUMN IF NOT EXISTS role_level SMALLINT NOT NULL DEFAULT 1",
+    f"UPDATE users SET role_level = {_ROLE_LEVEL_SQL} WHERE role_level <> {_ROLE_LEVEL_SQL}",
+    "CREATE INDEX IF NOT EXISTS ix_users_role_level ON users (role_level)",
+    "CREATE INDEX IF NOT EXISTS ix_users_firebase_uid_covering ON users (firebase_uid) "
+    "INCLUDE (id, role, role_level, email, name)"
+)
 
 class Prophecy(Base):
     __tablename__ = "prophecies"
+    __table_args__ = (
+        # Recent-activity counts, status filters and per-user listings in analytics
+        Index("ix_prophecies_timestamp", "timestamp"),
+        Index("ix_prophecies_status_timestamp", "status", "timestamp"),
+        Index("ix_prophecies_user_id_timestamp", "user_id", "timestamp"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     message = Column(Text, nullable=False)
-    timestamp = Column(DateTime, default=datetime.utcnow)
+    timestamp = Column(DateTime, server_default=utcnow())
     urgency = Column(Enum(UrgencyEnum), default=UrgencyEnum.MEDIUM)
     assigned_to = Column(String, nullable=False)
     role = Column(Enum(RoleEnum), nullable=False)
@@ -61,8 +122,39 @@ class Prophecy(Base):
     user = relationship("User", back_populates="prophecies")
     scroll_cycle = relationship("ScrollCycle", back_populates="prophecies")
 
+# Backs the date(timestamp) group-by used for daily trends
+Index("ix_prophecies_date", func.date(Prophecy.timestamp))
+
+# Per-day prophecy totals for trend charts, maintained by app.summaries (PostgreSQL only)
+prophecy_daily_counts = table(
+    "prophecy_daily_counts",
+    column("d", Date),
+    column("c", Integer)
+)
+
+# Idempotent, so app.summaries also runs them at startup for databases created before the view.
+# REFRESH ... CONCURRENTLY requires the unique index on the view.
+PROPHECY_DAILY_COUNTS_DDL = (
+    "CREATE MATERIALIZED VIEW IF NOT EXISTS prophecy_daily_counts AS "
+    "SELECT date(timestamp) AS d, count(*) AS c FROM prophecies GROUP BY 1",
+    "CREATE UNIQUE INDEX IF NOT EXISTS ix_prophecy_daily_counts_d "
+    "ON prophecy_daily_counts (d)"
+)
+
+for _statement in PROPHECY_DAILY_COUNTS_DDL:
+    event.listen(
+        Prophecy.__table__,
+        "after_create",
+        DDL(_statement).execute_if(dialect="postgresql")
+    )
+
 class ScrollCycle(Base):
     __tablename__ = "scroll_cycles"
+    __table_args__ = (
+        # Dashboard listings filter by status or creator and take the newest few
+        Index("ix_scroll_cycles_status_created_at", "status", text("created_at DESC")),
+        Index("ix_scroll_cycles_creator_id_created_at", "creator_id", text("created_at DESC")),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)
@@ -72,7 +164,7 @@ class ScrollCycle(Base):
     prophecies_count = Column(Integer, default=0)
     status = Column(Enum(CycleStatusEnum), default=CycleStatusEnum.SCHEDULED)
     creator_id = Column(Integer, ForeignKey("users.id"))
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
     
     # Relationships
     creator = relationship("User", back_populates="scroll_cycles")
@@ -90,7 +182,7 @@ class PrayerSession(Base):
     stream_url = Column(String)
     participants_count = Column(Integer, default=0)
     creator_id = Column(Integer, ForeignKey("users.id"))
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
 
 class BibleCharacter(Base):
     __tablename__ = "bible_characters"
@@ -101,7 +193,35 @@ class BibleCharacter(Base):
     avatar_url = Column(String)
     personality_prompt = Column(Text)
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
+
+# Dimension of the text-embedding-3-small vectors stored in chat_cache
+CHAT_EMBEDDING_DIMENSIONS = 1536
+
+class ChatCache(Base):
+    __tablename__ = "chat_cache"
+    __table_args__ = (
+        # Approximate nearest-neighbour search by cosine distance
+        Index(
+            "ix_chat_cache_embedding",
+            "embedding",
+            postgresql_using="ivfflat",
+            postgresql_with={"lists": 100},
+            postgresql_ops={"embedding": "vector_cosine_ops"}
+        ),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    character = Column(String, nullable=False, index=True)
+    embedding = Column(Vector(CHAT_EMBEDDING_DIMENSIONS), nullable=False)
+    response = Column(Text, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow())
+
+event.listen(
+    ChatCache.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS vector").execute_if(dialect="postgresql")
+)
 
 class HolyLandScene(Base):
     __tablename__ = "holy_land_scenes"
@@ -112,7 +232,7 @@ class HolyLandScene(Base):
     scene_data = Column(Text)  # JSON data for 3D scene
     triggers = Column(Text)  # JSON data for scroll triggers
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
 
 class ScrollComposition(Base):
     __tablename__ = "scroll_compositions"
@@ -122,8 +242,18 @@ class ScrollComposition(Base):
     content = Column(Text)  # JSON data for slide content
     creator_id = Column(Integer, ForeignKey("users.id"))
     is_published = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow())
+
+class ActivityEvent(Base):
+    __tablename__ = "activity_events"
+    
+    # Assigned by the API before the buffered insert so it can be returned immediately
+    id = Column(String(36), primary_key=True)
+    kind = Column(String, nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), index=True)
+    payload = Column(Text)  # JSON data describing the event
+    created_at = Column(DateTime, server_default=utcnow(), index=True)
 
 class LivestreamSession(Base):
     __tablename__ = "livestream_sessions"
@@ -138,4 +268,4 @@ class LivestreamSession(Base):
     scheduled_at = Column(DateTime)
     started_at = Column(DateTime)
     ended_at = Column(DateTime)
-    created_at = Column(DateTime, default=datetime.utcnow) 
\ No newline at end of file
+    created_at = Column(DateTime, server_default=utcnow()) 
\ No newline at end of file
@@ -15,13 +15,13 @@ class ScrollLicenseRequest(Base):
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(255), nullable=False)
     email = Column(String(255), unique=True, nullable=False, index=True)
-    role = Column(String(50), nullable=False)
+    role = Column(String(50), nullable=False, index=True)
     purpose = Column(Text, nullable=False)
-    country = Column(String(10), nullable=False)
+    country = Column(String(10), nullable=False, index=True)
     ministry = Column(String(255), nullable=False)
     team_size = Column(String(20), nullable=False)
     experience = Column(String(20), nullable=False)
-    status = Column(Enum(RequestStatus), default=RequestStatus.PENDING)
+    status = Column(Enum(RequestStatus), default=RequestStatus.PENDING, index=True)
     access_token = Column(String(255), unique=True, nullable=True)
     activated_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=func.now())
@@ -1,46 +1,106 @@
 from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi.responses import Response
 from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
+import asyncio
 import json
-from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, desc, bindparam, lambda_stmt
 
-from ..database import get_db
+from .. import summaries
+from ..database import get_async_db, AsyncSessionLocal
+from ..cache import get_cached, set_cached
 from ..auth import verify_token_and_role
-from ..models import User, Prophecy, ScrollCycle, PrayerRequest
+from ..models import User, Prophecy, ScrollCycle, PrayerRequest, RoleEnum, StatusEnum, prophecy_daily_counts
 from ..schemas.analytics import AnalyticsOverview, TopVerse, PrayerTopic, LivestreamStats
 
 router = APIRouter()
 
+# Dashboards poll these aggregates; a short TTL keeps them fresh enough
+ANALYTICS_CACHE_TTL_SECONDS = 30
+
+# Count statements are structurally fixed; lambda_stmt caches their construction as well as
+# their compiled SQL, and only the bound parameters vary per request
+_USER_COUNTS = lambda_stmt(lambda: select(
+    func.count().label("total"),
+    func.count().filter(User.role == RoleEnum.DEACON).label("deacons"),
+    func.count().filter(User.role == RoleEnum.ELDER).label("elders"),
+    func.count().filter(User.role == RoleEnum.APOSTLE).label("apostles"),
+    func.count().filter(User.role == RoleEnum.NATION_SEER).label("nation_seers")
+).select_from(User))
+
+_PROPHECY_COUNTS = lambda_stmt(lambda: select(
+    func.count().label("total"),
+    func.count().filter(Prophecy.timestamp >= bindparam("since")).label("recent"),
+    func.count().filter(Prophecy.status == StatusEnum.PENDING).label("pending"),
+    func.count().filter(Prophecy.status == StatusEnum.IN_PROGRESS).label("in_progress"),
+    func.count().filter(Prophecy.status == StatusEnum.COMPLETED).label("completed")
+).select_from(Prophecy))
+
+_PRAYER_COUNTS = lambda_stmt(lambda: select(
+    func.count().label("total"),
+    func.count().filter(PrayerRequest.created_at >= bindparam("since")).label("recent")
+).select_from(PrayerRequest))
+
+_SCROLL_CYCLE_COUNTS = lambda_stmt(lambda: select(func.count().label("total")).select_from(ScrollCycle))
+
+# Half-open ranges on the bare column, rather than date(column) == day, so B-tree indexes apply
+_PROPHECIES_ON_DAY = lambda_stmt(lambda: select(func.count()).select_from(Prophecy).where(
+    Prophecy.timestamp >= bindparam("day_start"),
+    Prophecy.timestamp < bindparam("day_end")
+))
+_PRAYERS_ON_DAY = lambda_stmt(lambda: select(func.count()).select_from(PrayerRequest).where(
+    PrayerRequest.created_at >= bindparam("day_start"),
+    PrayerRequest.created_at < bindparam("day_end")
+))
+_USERS_ON_DAY = lambda_stmt(lambda: select(func.count()).select_from(User).where(
+    User.created_at >= bindparam("day_start"),
+    User.created_at < bindparam("day_end")
+))
+
+_USER_PROPHECY_COUNT = lambda_stmt(lambda: select(func.count()).select_from(Prophecy).where(
+    Prophecy.user_id == bindparam("user_id")
+))
+_USER_PRAYER_COUNT = lambda_stmt(lambda: select(func.count()).select_from(PrayerRequest).where(
+    PrayerRequest.user_id == bindparam("user_id")
+))
+_USER_SCROLL_CYCLE_COUNT = lambda_stmt(lambda: select(func.count()).select_from(ScrollCycle).where(
+    ScrollCycle.user_id == bindparam("user_id")
+))
+
+async def _fetch_one(stmt, params=None):
+    """Run a single-row query on its own session so independent queries can overlap"""
+    async with AsyncSessionLocal() as session:
+        return (await session.execute(stmt, params)).one()
+
 @router.get("/overview", response_model=AnalyticsOverview)
 async def get_analytics_overview(
-    current_user: Dict = Depends(verify_token_and_role("Apostle")),
-    db: Session = Depends(get_db)
+    current_user: Dict = Depends(verify_token_and_role("Apostle"))
 ):
     """
     Get comprehensive analytics overview for sacred dashboard
     Access: Apostle role required
     """
     try:
+        cache_key = "analytics:overview:v1"
+        cached = await get_cached(cache_key)
+        if cached:
+            return Response(content=cached, media_type="application/json")
+        
         # Calculate date ranges
         now = datetime.utcnow()
         last_7_days = now - timedelta(days=7)
         last_30_days = now - timedelta(days=30)
         
-        # Get total counts
-        total_users = db.query(User).count()
-        total_prophecies = db.query(Prophecy).count()
-        total_scroll_cycles = db.query(ScrollCycle).count()
-        total_prayers = db.query(PrayerRequest).count()
-        
-        # Get recent activity
-        recent_prophecies = db.query(Prophecy).filter(
-            Prophecy.created_at >= last_7_days
-        ).count()
-        
-        recent_prayers = db.query(PrayerRequest).filter(
-            PrayerRequest.created_at >= last_7_days
-        ).count()
+        # One scan per table: totals, recent activity and distributions via FILTER aggregates.
+        # The tables are independent, so the scans run concurrently on separate sessions.
+        user_counts, prophecy_counts, prayer_counts, scroll_cycle_counts = await asyncio.gather(
+            _fetch_one(_USER_COUNTS),
+            _fetch_one(_PROPHECY_COUNTS, {"since": last_7_days}),
+            _fetch_one(_PRAYER_COUNTS, {"since": last_7_days}),
+            _fetch_one(_SCROLL_CYCLE_COUNTS)
+        )
+        total_scroll_cycles = scroll_cycle_counts.total
         
         # Get top verses (mock data for now)
         top_verses = [
@@ -132,29 +192,26 @@ async def get_analytics_overview(
             "sunday": {"morning": 45, "afternoon": 52, "evening": 38}
         }
         
-        # Get role distribution
         role_distribution = {
-            "Deacon": db.query(User).filter(User.role == "Deacon").count(),
-            "Elder": db.query(User).filter(User.role == "Elder").count(),
-            "Apostle": db.query(User).filter(User.role == "Apostle").count(),
-            "Nation Seer": db.query(User).filter(User.role == "Nation Seer").count()
+            "Deacon": user_counts.deacons,
+            "Elder": user_counts.elders,
+            "Apostle": user_counts.apostles,
+            "Nation Seer": user_counts.nation_seers
         }
         
-        # Get prophecy status distribution
         prophecy_status = {
-            "Pending": db.query(Prophecy).filter(Prophecy.status == "Pending").count(),
-            "Active": db.query(Prophecy).filter(Prophecy.status == "Active").count(),
-            "Fulfilled": db.query(Prophecy).filter(Prophecy.status == "Fulfilled").count(),
-            "Archived": db.query(Prophecy).filter(Prophecy.status == "Archived").count()
+            StatusEnum.PENDING.value: prophecy_counts.pending,
+            StatusEnum.IN_PROGRESS.value: prophecy_counts.in_progress,
+            StatusEnum.COMPLETED.value: prophecy_counts.completed
         }
         
-        return AnalyticsOverview(
-            total_users=total_users,
-            total_prophecies=total_prophecies,
+        overview = AnalyticsOverview(
+            total_users=user_counts.total,
+            total_prophecies=prophecy_counts.total,
             total_scroll_cycles=total_scroll_cycles,
-            total_prayers=total_prayers,
-            recent_prophecies=recent_prophecies,
-            recent_prayers=recent_prayers,
+            total_prayers=prayer_counts.total,
+            recent_prophecies=prophecy_counts.recent,
+            recent_prayers=prayer_counts.recent,
             top_verses=top_verses,
             prayer_topics=prayer_topics,
             livestream_stats=livestream_stats,
@@ -164,6 +221,9 @@ async def get_analytics_overview(
             last_updated=now
         )
         
+        await set_cached(cache_key, overview.model_dump_json(), ANALYTICS_CACHE_TTL_SECONDS)
+        return overview
+        
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -173,7 +233,7 @@ async def get_analytics_overview(
 @router.get("/daily-stats")
 async def get_daily_stats(
     current_user: Dict = Depends(verify_token_and_role("Elder")),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get daily statistics for dashboard
@@ -182,20 +242,22 @@ async def get_daily_stats(
     try:
         today = datetime.utcnow().date()
         
+        cache_key = f"analytics:daily-stats:v1:{today.isoformat()}"
+        cached = await get_cached(cache_key)
+        if cached:
+            return Response(content=cached, media_type="application/json")
+        
         # Get today's stats
-        today_prophecies = db.query(Prophecy).filter(
-            func.date(Prophecy.created_at) == today
-        ).count()
+        day_start = datetime.combine(today, time.min)
+        day = {"day_start": day_start, "day_end": day_start + timedelta(days=1)}
         
-        today_prayers = db.query(PrayerRequest).filter(
-            func.date(PrayerRequest.created_at) == today
-        ).count()
+        today_prophecies = await db.scalar(_PROPHECIES_ON_DAY, day)
         
-        today_users = db.query(User).filter(
-            func.date(User.created_at) == today
-        ).count()
+        today_prayers = await db.scalar(_PRAYERS_ON_DAY, day)
         
-        return {
+        today_users = await db.scalar(_USERS_ON_DAY, day)
+        
+        daily_stats = {
             "date": today.isoformat(),
             "prophecies": today_prophecies,
             "prayers": today_prayers,
@@ -204,6 +266,9 @@ async def get_daily_stats(
             "scroll_cycles_completed": 3  # Mock data
         }
         
+        await set_cached(cache_key, json.dumps(daily_stats), ANALYTICS_CACHE_TTL_SECONDS)
+        return daily_stats
+        
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -214,14 +279,14 @@ async def get_daily_stats(
 async def get_user_activity(
     user_id: int,
     current_user: Dict = Depends(verify_token_and_role("Elder")),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get activity statistics for a specific user
     Access: Elder role required
     """
     try:
-        user = db.query(User).filter(User.id == user_id).first()
+        user = (await db.execute(select(User).where(User.id == user_id))).scalar_one_or_none()
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -229,19 +294,13 @@ async def get_user_activity(
             )
         
         # Get user's prophecies
-        user_prophecies = db.query(Prophecy).filter(
-            Prophecy.user_id == user_id
-        ).count()
+        user_prophecies = await db.scalar(_USER_PROPHECY_COUNT, {"user_id": user_id})
         
         # Get user's prayers
-        user_prayers = db.query(PrayerRequest).filter(
-            PrayerRequest.user_id == user_id
-        ).count()
+        user_prayers = await db.scalar(_USER_PRAYER_COUNT, {"user_id": user_id})
         
         # Get user's scroll cycles
-        user_scroll_cycles = db.query(ScrollCycle).filter(
-            ScrollCycle.user_id == user_id
-        ).count()
+        user_scroll_cycles = await db.scalar(_USER_SCROLL_CYCLE_COUNT, {"user_id": user_id})
         
         return {
             "user_id": user_id,
@@ -264,28 +323,44 @@ async def get_user_activity(
 async def get_prophecy_trends(
     days: int = 30,
     current_user: Dict = Depends(verify_token_and_role("Apostle")),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get prophecy trends over specified days
     Access: Apostle role required
     """
     try:
+        cache_key = f"analytics:prophecy-trends:v1:{days}"
+        cached = await get_cached(cache_key)
+        if cached:
+            return Response(content=cached, media_type="application/json")
+        
         end_date = datetime.utcnow()
         start_date = end_date - timedelta(days=days)
         
         # Get prophecies by date
-        prophecies = db.query(
-            func.date(Prophecy.created_at).label('date'),
-            func.count(Prophecy.id).label('count')
-        ).filter(
-            Prophecy.created_at >= start_date,
-            Prophecy.created_at <= end_date
-        ).group_by(
-            func.date(Prophecy.created_at)
-        ).order_by(
-            func.date(Prophecy.created_at)
-        ).all()
+        if summaries.prophecy_daily_counts_ready:
+            # Range scan over the precomputed per-day summary instead of the full table
+            prophecies = (await db.execute(select(
+                prophecy_daily_counts.c.d.label('date'),
+                prophecy_daily_counts.c.c.label('count')
+            ).where(
+                prophecy_daily_counts.c.d.between(start_date.date(), end_date.date())
+            ).order_by(
+                prophecy_daily_counts.c.d
+            ))).all()
+        else:
+            prophecies = (await db.execute(select(
+                func.date(Prophecy.timestamp).label('date'),
+                func.count(Prophecy.id).label('count')
+            ).where(
+                Prophecy.timestamp >= start_date,
+                Prophecy.timestamp <= end_date
+            ).group_by(
+                func.date(Prophecy.timestamp)
+            ).order_by(
+                func.date(Prophecy.timestamp)
+            ))).all()
         
         # Format data for frontend
         trends = []
@@ -295,7 +370,7 @@ async def get_prophecy_trends(
                 "count": prophecy.count
             })
         
-        return {
+        prophecy_trends = {
             "period_days": days,
             "start_date": start_date.isoformat(),
             "end_date": end_date.isoformat(),
@@ -303,6 +378,9 @@ async def get_prophecy_trends(
             "total_prophecies": sum(t['count'] for t in trends)
         }
         
+        await set_cached(cache_key, json.dumps(prophecy_trends), ANALYTICS_CACHE_TTL_SECONDS)
+        return prophecy_trends
+        
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
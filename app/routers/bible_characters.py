@@ -1,14 +1,21 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.orm import Session
-from typing import Dict, Any, List
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, Any, List, Optional
 from pydantic import BaseModel
 from openai import AsyncOpenAI
+import httpx
 import os
+import json
+import orjson
 import logging
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
 
-from ..database import get_db
-from ..models import BibleCharacter, User
+from ..database import get_db, get_async_db, AsyncSessionLocal
+from ..models import BibleCharacter, User, ChatCache
 from ..auth import get_current_user
 
 # Configure logging
@@ -16,8 +23,26 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# Initialize OpenAI client with async support
-client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# Initialize OpenAI client with async support; the pool is sized for bursts of concurrent chats
+client = AsyncOpenAI(
+    api_key=os.getenv("OPENAI_API_KEY"),
+    http_client=httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        timeout=httpx.Timeout(30.0, connect=5.0)
+    )
+)
+
+# /healthz answers from the last probe for this long, so polling can't spend API quota
+HEALTH_CHECK_TTL_SECONDS = 30
+
+_last_health_check = (float("-inf"), False)
+
+# Near-duplicate questions reuse a stored answer instead of calling GPT-4 again. The prompt
+# holds only the character and the message, so answers are shared across users; never put
+# user-specific context into it without also keying the cache by user.
+CHAT_EMBEDDING_MODEL = "text-embedding-3-small"
+CHAT_CACHE_MIN_SIMILARITY = 0.95
+CHAT_CACHE_TTL = timedelta(days=7)
 
 # Pydantic models for request/response validation
 class ChatRequest(BaseModel):
@@ -70,6 +95,142 @@ CHARACTER_PROFILES = {
     }
 }
 
+# Sacred system prompts and character responses are fixed, so build them once at import
+for name, profile in CHARACTER_PROFILES.items():
+    profile["system_prompt"] = f"""You are {name}, a biblical figure from the sacred scriptures. 
+
+Personality: {profile['personality']}
+Speaking Style: {profile['speaking_style']}
+Knowledge Base: {profile['knowledge_base']}
+Sacred Purpose: {profile['sacred_purpose']}
+
+Respond as {name} would, staying true to their biblical character, personality, and speaking style. Use their typical phrases and mannerisms. Keep responses concise but meaningful, as if having a personal conversation with a modern believer.
+
+Remember: You are {name} speaking to a modern believer seeking spiritual guidance. Share wisdom, encouragement, or guidance as {name} would, drawing from their biblical experiences and knowledge. Keep responses under 200 words and maintain the sacred, respectful tone appropriate for spiritual counsel."""
+
+CHARACTER_INFO_JSON = {
+    name: orjson.dumps({
+        "name": name,
+        "personality": profile["personality"],
+        "speaking_style": profile["speaking_style"],
+        "knowledge_base": profile["knowledge_base"],
+        "sacred_purpose": profile["sacred_purpose"],
+        "avatar_url": f"/api/v1/characters/{name.lower()}/avatar"
+    })
+    for name, profile in CHARACTER_PROFILES.items()
+}
+
+AVAILABLE_CHARACTERS_JSON = orjson.dumps({
+    "characters": [
+        {
+            "name": name,
+            "personality": profile["personality"][:100] + "...",
+            "sacred_purpose": profile["sacred_purpose"][:100] + "...",
+            "avatar_url": f"/api/v1/characters/{name.lower()}/avatar"
+        }
+        for name, profile in CHARACTER_PROFILES.items()
+    ]
+})
+
+async def warm_openai_client() -> bool:
+    """Open a pooled TLS connection to OpenAI ahead of the first chat; True if reachable"""
+    try:
+        await client.models.list()
+        return True
+    except Exception as e:
+        logger.warning("OpenAI warmup failed: %s", e)
+        return False
+
+async def close_openai_client() -> None:
+    """Close the pooled OpenAI HTTP connections; called on shutdown"""
+    await client.close()
+
+def _validate_chat_request(chat_request: ChatRequest):
+    """Normalize the character name and message, rejecting unknown characters and empty messages"""
+    character_name = chat_request.character.title()
+    user_message = chat_request.message.strip()
+    
+    # Validate character exists
+    if character_name not in CHARACTER_PROFILES:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Character '{character_name}' not found in our sacred library"
+        )
+    
+    # Validate message
+    if not user_message:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Message cannot be empty"
+        )
+    
+    return character_name, user_message
+
+def _sse_event(data: Dict[str, Any], event: Optional[str] = None) -> str:
+    """Format one Server-Sent Event; JSON keeps newlines in the text from splitting the frame"""
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(data)}\n\n"
+
+async def _embed_message(message: str) -> Optional[List[float]]:
+    """Embed a chat message for the semantic cache; None disables caching for this message"""
+    try:
+        result = await client.embeddings.create(model=CHAT_EMBEDDING_MODEL, input=message)
+        return result.data[0].embedding
+    except Exception as e:
+        logger.warning("Embedding failed, skipping chat cache: %s", e)
+        return None
+
+async def _cached_response(db: AsyncSession, character: str, embedding: List[float]) -> Optional[str]:
+    """Return the stored response to the most similar earlier message, if it is close enough"""
+    distance = ChatCache.embedding.cosine_distance(embedding)
+    row = (await db.execute(
+        select(ChatCache.response, distance.label("distance"))
+        .where(
+            ChatCache.character == character,
+            ChatCache.created_at >= datetime.utcnow() - CHAT_CACHE_TTL
+        )
+        .order_by(distance)
+        .limit(1)
+    )).first()
+    if row is not None and 1 - row.distance >= CHAT_CACHE_MIN_SIMILARITY:
+        return row.response
+    return None
+
+async def _store_cached_response(db: AsyncSession, character: str, embedding: List[float], response: str) -> None:
+    """
+    Best-effort store of a fresh answer; a failure only costs a future cache hit.
+    Expired entries for the character are pruned on the way, which keeps the table bounded.
+    """
+    try:
+        await db.execute(
+            delete(ChatCache).where(
+                ChatCache.character == character,
+                ChatCache.created_at < datetime.utcnow() - CHAT_CACHE_TTL
+            )
+        )
+        db.add(ChatCache(character=character, embedding=embedding, response=response))
+        await db.commit()
+    except Exception as e:
+        await db.rollback()
+        logger.warning("Failed to store chat in cache: %s", e)
+
+@router.get("/healthz")
+async def openai_health():
+    """Check OpenAI reachability, probing at most once per HEALTH_CHECK_TTL_SECONDS"""
+    global _last_health_check
+    checked_at, healthy = _last_health_check
+    now = time.monotonic()
+    if now - checked_at >= HEALTH_CHECK_TTL_SECONDS:
+        _last_health_check = (now, healthy)  # concurrent polls reuse the previous answer meanwhile
+        healthy = await warm_openai_client()
+        _last_health_check = (time.monotonic(), healthy)
+    if not healthy:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Sacred AI service is unreachable"
+        )
+    return {"status": "healthy"}
+
 @router.get("/ai-character/{name}")
 async def get_character_info(
     name: str,
@@ -78,24 +239,16 @@ async def get_character_info(
     """Get sacred information about a Bible character"""
     try:
         character_name = name.title()
-        if character_name not in CHARACTER_PROFILES:
+        character_info = CHARACTER_INFO_JSON.get(character_name)
+        if character_info is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Character '{name}' not found in our sacred library"
             )
         
-        profile = CHARACTER_PROFILES[character_name]
-        
         logger.info(f"User {current_user.name} accessed character info for {character_name}")
         
-        return {
-            "name": character_name,
-            "personality": profile["personality"],
-            "speaking_style": profile["speaking_style"],
-            "knowledge_base": profile["knowledge_base"],
-            "sacred_purpose": profile["sacred_purpose"],
-            "avatar_url": f"/api/v1/characters/{character_name.lower()}/avatar"
-        }
+        return Response(content=character_info, media_type="application/json")
     except HTTPException:
         raise
     except Exception as e:
@@ -108,64 +261,51 @@ async def get_character_info(
 @router.post("/ai-character/chat", response_model=ChatResponse)
 async def chat_with_character(
     chat_request: ChatRequest,
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Chat with an AI-powered Bible character using OpenAI GPT-4"""
     try:
-        character_name = chat_request.character.title()
-        user_message = chat_request.message.strip()
-        
-        # Validate character exists
-        if character_name not in CHARACTER_PROFILES:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Character '{character_name}' not found in our sacred library"
-            )
-        
-        # Validate message
-        if not user_message:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Message cannot be empty"
-            )
-        
+        character_name, user_message = _validate_chat_request(chat_request)
         profile = CHARACTER_PROFILES[character_name]
         
-        # Create the sacred system prompt for the character
-        system_prompt = f"""You are {character_name}, a biblical figure from the sacred scriptures. 
-
-Personality: {profile['personality']}
-Speaking Style: {profile['speaking_style']}
-Knowledge Base: {profile['knowledge_base']}
-Sacred Purpose: {profile['sacred_purpose']}
-
-Respond as {character_name} would, staying true to their biblical character, personality, and speaking style. Use their typical phrases and mannerisms. Keep responses concise but meaningful, as if having a personal conversation with a modern believer.
-
-Remember: You are {character_name} speaking to a modern believer seeking spiritual guidance. Share wisdom, encouragement, or guidance as {character_name} would, drawing from their biblical experiences and knowledge. Keep responses under 200 words and maintain the sacred, respectful tone appropriate for spiritual counsel."""
+        system_prompt = profile["system_prompt"]
+        
+        # The semantic cache relies on pgvector, so it is only consulted on PostgreSQL
+        embedding = None
+        character_response = None
+        if db.bind.dialect.name == "postgresql":
+            embedding = await _embed_message(user_message)
+            if embedding is not None:
+                character_response = await _cached_response(db, character_name, embedding)
 
-        # Call OpenAI API with async handling
-        try:
-            response = await client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_message}
-                ],
-                max_tokens=300,
-                temperature=0.7,
-                presence_penalty=0.1,
-                frequency_penalty=0.1
-            )
+        if character_response is None:
+            # Call OpenAI API with async handling
+            try:
+                response = await client.chat.completions.create(
+                    model="gpt-4",
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_message}
+                    ],
+                    max_tokens=300,
+                    temperature=0.7,
+                    presence_penalty=0.1,
+                    frequency_penalty=0.1
+                )
+                
+                character_response = response.choices[0].message.content or ""
+                character_response = character_response.strip()
+                
+            except Exception as e:
+                logger.error(f"OpenAI API error: {str(e)}")
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail="Sacred AI service encountered an error"
+                )
             
-            character_response = response.choices[0].message.content or ""
-            character_response = character_response.strip()
-            
-        except Exception as e:
-            logger.error(f"OpenAI API error: {str(e)}")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Sacred AI service encountered an error"
-            )
+            if embedding is not None and character_response:
+                await _store_cached_response(db, character_name, embedding, character_response)
         
         # Log the interaction for sacred purposes
         logger.info(f"User {current_user.name} chatted with {character_name}")
@@ -186,24 +326,82 @@ Remember: You are {character_name} speaking to a modern believer seeking spiritu
             detail="Sacred error occurred during character interaction"
         )
 
+@router.post("/ai-character/chat/stream")
+async def stream_chat_with_character(
+    chat_request: ChatRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Chat with a Bible character, streaming the reply as Server-Sent Events
+    Emits `data: {"content": ...}` per token chunk, then `event: done` with the full reply
+    """
+    character_name, user_message = _validate_chat_request(chat_request)
+    system_prompt = CHARACTER_PROFILES[character_name]["system_prompt"]
+    
+    embedding = None
+    cached_response = None
+    if db.bind.dialect.name == "postgresql":
+        embedding = await _embed_message(user_message)
+        if embedding is not None:
+            cached_response = await _cached_response(db, character_name, embedding)
+    
+    async def event_stream():
+        if cached_response is not None:
+            yield _sse_event({"content": cached_response})
+            yield _sse_event({"character": character_name, "character_response": cached_response}, event="done")
+            return
+        
+        parts = []
+        try:
+            stream = await client.chat.completions.create(
+                model="gpt-4",
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_message}
+                ],
+                max_tokens=300,
+                temperature=0.7,
+                presence_penalty=0.1,
+                frequency_penalty=0.1,
+                stream=True
+            )
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                content = chunk.choices[0].delta.content
+                if content:
+                    parts.append(content)
+                    yield _sse_event({"content": content})
+        except Exception as e:
+            logger.error("OpenAI streaming error: %s", e)
+            yield _sse_event({"detail": "Sacred AI service encountered an error"}, event="error")
+            return
+        
+        character_response = "".join(parts).strip()
+        logger.info("User %s chatted with %s (streamed)", current_user.name, character_name)
+        yield _sse_event({"character": character_name, "character_response": character_response}, event="done")
+        
+        # The request's session is already closed once streaming starts, so store on a fresh one
+        if embedding is not None and character_response:
+            async with AsyncSessionLocal() as session:
+                await _store_cached_response(session, character_name, embedding, character_response)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @router.get("/characters")
 async def get_available_characters(
     current_user: User = Depends(get_current_user)
 ):
     """Get list of available sacred Bible characters"""
     try:
-        characters = []
-        for name, profile in CHARACTER_PROFILES.items():
-            characters.append({
-                "name": name,
-                "personality": profile["personality"][:100] + "...",
-                "sacred_purpose": profile["sacred_purpose"][:100] + "...",
-                "avatar_url": f"/api/v1/characters/{name.lower()}/avatar"
-            })
-        
         logger.info(f"User {current_user.name} accessed available characters")
         
-        return {"characters": characters}
+        return Response(content=AVAILABLE_CHARACTERS_JSON, media_type="application/json")
         
     except Exception as e:
         logger.error(f"Error fetching characters: {str(e)}")
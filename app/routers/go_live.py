@@ -1,7 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import Response
 from sqlalchemy.orm import Session
 from typing import Dict, Any
 from datetime import datetime
+import orjson
 
 from ..database import get_db
 from ..models import LivestreamSession, User
@@ -9,6 +11,36 @@ from ..auth import get_current_user
 
 router = APIRouter()
 
+# Topics are fixed, so the response body is serialized once at import
+LIVESTREAM_TOPICS_JSON = orjson.dumps({
+    "topics": [
+        {
+            "id": "warfare_prayer",
+            "name": "Warfare Prayer",
+            "description": "Spiritual warfare and intercession",
+            "duration": 60
+        },
+        {
+            "id": "open_heaven_ghana",
+            "name": "Open Heaven: Ghana",
+            "description": "Prophetic intercession for Ghana",
+            "duration": 90
+        },
+        {
+            "id": "revival_fire",
+            "name": "Revival Fire",
+            "description": "Calling for revival and awakening",
+            "duration": 120
+        },
+        {
+            "id": "prophetic_worship",
+            "name": "Prophetic Worship",
+            "description": "Worship and prophetic flow",
+            "duration": 75
+        }
+    ]
+})
+
 @router.post("/go-live/start")
 async def start_livestream(
     stream_data: Dict[str, Any],
@@ -85,37 +117,4 @@ async def get_livestream_topics(
     current_user: User = Depends(get_current_user)
 ):
     """Get available livestream topics"""
-    try:
-        topics = [
-            {
-                "id": "warfare_prayer",
-                "name": "Warfare Prayer",
-                "description": "Spiritual warfare and intercession",
-                "duration": 60
-            },
-            {
-                "id": "open_heaven_ghana",
-                "name": "Open Heaven: Ghana",
-                "description": "Prophetic intercession for Ghana",
-                "duration": 90
-            },
-            {
-                "id": "revival_fire",
-                "name": "Revival Fire",
-                "description": "Calling for revival and awakening",
-                "duration": 120
-            },
-            {
-                "id": "prophetic_worship",
-                "name": "Prophetic Worship",
-                "description": "Worship and prophetic flow",
-                "duration": 75
-            }
-        ]
-        
-        return {"topics": topics}
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error fetching topics: {str(e)}"
-        ) 
\ No newline at end of file
+    return Response(content=LIVESTREAM_TOPICS_JSON, media_type="application/json") 
\ No newline at end of file
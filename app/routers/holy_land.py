@@ -1,14 +1,22 @@
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import Response
 from sqlalchemy.orm import Session
 from typing import Dict, Any
 from datetime import datetime
+import json
 
+from .. import event_writer
 from ..database import get_db
+from ..cache import get_cached, set_cached
 from ..models import HolyLandScene, User
 from ..auth import get_current_user
 
 router = APIRouter()
 
+# Scenes are curated content that rarely changes, so the listing is shared via Redis
+HOLY_LAND_SCENES_CACHE_KEY = "holy-land:scenes:v1"
+HOLY_LAND_SCENES_CACHE_TTL_SECONDS = 300
+
 @router.get("/holy-land/scenes")
 async def get_holy_land_scenes(
     current_user: User = Depends(get_current_user),
@@ -16,9 +24,20 @@ async def get_holy_land_scenes(
 ):
     """Get available Holy Land scenes"""
     try:
-        scenes = db.query(HolyLandScene).filter(HolyLandScene.is_active == True).all()
+        cached = await get_cached(HOLY_LAND_SCENES_CACHE_KEY)
+        if cached:
+            return Response(content=cached, media_type="application/json")
+        
+        # Select just the served columns in one query; no ORM objects or lazy loads involved
+        scenes = db.query(
+            HolyLandScene.id,
+            HolyLandScene.name,
+            HolyLandScene.description,
+            HolyLandScene.scene_data,
+            HolyLandScene.triggers
+        ).filter(HolyLandScene.is_active == True).all()
         
-        return {
+        result = {
             "scenes": [
                 {
                     "id": scene.id,
@@ -30,6 +49,9 @@ async def get_holy_land_scenes(
                 for scene in scenes
             ]
         }
+        
+        await set_cached(HOLY_LAND_SCENES_CACHE_KEY, json.dumps(result), HOLY_LAND_SCENES_CACHE_TTL_SECONDS)
+        return result
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -43,13 +65,15 @@ async def log_visit(
 ):
     """Log a visit to a Holy Land scene"""
     try:
-        return {
+        visit = {
             "user_id": current_user.id,
             "scene_id": visit_data["scene_id"],
             "visit_time": datetime.utcnow().isoformat(),
             "coordinates": visit_data.get("coordinates"),
             "triggers_activated": visit_data.get("triggers", [])
         }
+        visit_id = event_writer.record("scene_visited", current_user.id, visit)
+        return {"visit_id": visit_id, **visit}
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -1,10 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Dict, Any
 from datetime import datetime
 
-from ..database import get_db
-from ..models import User
+from .. import event_writer
+from ..database import get_db, get_async_db
+from ..models import User, Prophecy, UrgencyEnum
 from ..auth import get_current_user
 
 router = APIRouter()
@@ -16,13 +19,14 @@ async def start_service(
 ):
     """Start a service from mobile control"""
     try:
-        return {
-            "service_id": "service_123",
+        service = {
             "type": service_data["type"],
             "started_by": current_user.name,
             "start_time": datetime.utcnow().isoformat(),
             "status": "active"
         }
+        service_id = event_writer.record("service_started", current_user.id, service)
+        return {"service_id": service_id, **service}
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -36,14 +40,15 @@ async def project_content(
 ):
     """Project prayer or scripture remotely"""
     try:
-        return {
-            "projection_id": "proj_456",
+        projection = {
             "content_type": content_data["type"],
             "content": content_data["content"],
             "projected_by": current_user.name,
             "projection_time": datetime.utcnow().isoformat(),
             "duration": content_data.get("duration", 30)
         }
+        projection_id = event_writer.record("content_projected", current_user.id, projection)
+        return {"projection_id": projection_id, **projection}
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -53,14 +58,37 @@ async def project_content(
 @router.post("/mobile/push-prophecy")
 async def push_prophecy(
     prophecy_data: Dict[str, Any],
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Push prophecies to dashboard from mobile"""
+    if not prophecy_data.get("message"):
+        raise HTTPException(status_code=400, detail="Prophecy message is required")
     try:
+        urgency = UrgencyEnum(prophecy_data.get("urgency", "medium"))
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid urgency. Expected one of: {', '.join(u.value for u in UrgencyEnum)}"
+        )
+    
+    try:
+        # Prophecies feed the dashboard directly, so they are written synchronously
+        prophecy_id = await db.scalar(
+            insert(Prophecy).values(
+                message=prophecy_data["message"],
+                urgency=urgency,
+                assigned_to="dashboard",
+                role=current_user.role,
+                user_id=current_user.id
+            ).returning(Prophecy.id)
+        )
+        await db.commit()
+        
         return {
-            "prophecy_id": "prop_789",
+            "prophecy_id": prophecy_id,
             "message": prophecy_data["message"],
-            "urgency": prophecy_data.get("urgency", "medium"),
+            "urgency": urgency.value,
             "pushed_by": current_user.name,
             "push_time": datetime.utcnow().isoformat(),
             "status": "pushed_to_dashboard"
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
+from sqlalchemy import insert
 from typing import Dict, Any
 from datetime import datetime
 
@@ -9,6 +10,13 @@ from ..auth import get_current_user
 
 router = APIRouter()
 
+# Every room shares the same ICE configuration; built once rather than per join
+WEBRTC_CONFIG = {
+    "ice_servers": [
+        {"urls": "stun:stun.l.google.com:19302"}
+    ]
+}
+
 @router.post("/start-stream")
 async def start_stream(
     stream_data: Dict[str, Any],
@@ -17,21 +25,21 @@ async def start_stream(
 ):
     """Start a new prayer livestream"""
     try:
-        session = PrayerSession(
-            title=stream_data["title"],
-            description=stream_data.get("description", ""),
-            start_time=datetime.utcnow(),
-            is_live=True,
-            creator_id=current_user.id
-        )
-        
-        db.add(session)
+        # INSERT ... RETURNING gets the new id in the same round trip, no refresh needed
+        session = db.execute(
+            insert(PrayerSession).values(
+                title=stream_data["title"],
+                description=stream_data.get("description", ""),
+                start_time=datetime.utcnow(),
+                is_live=True,
+                creator_id=current_user.id
+            ).returning(PrayerSession.id, PrayerSession.is_live)
+        ).one()
         db.commit()
-        db.refresh(session)
         
         return {
             "id": session.id,
-            "title": session.title,
+            "title": stream_data["title"],
             "stream_url": f"rtmp://localhost/live/prayer_{session.id}",
             "is_live": session.is_live
         }
@@ -54,12 +62,8 @@ async def join_prayer_room(
             "room_id": room_id,
             "user_id": current_user.id,
             "user_name": current_user.name,
-            "join_time": datetime.utcnow().isoformat(),
-            "webrtc_config": {
-                "ice_servers": [
-                    {"urls": "stun:stun.l.google.com:19302"}
-                ]
-            }
+            "join_time": datetime.utcnow(),
+            "webrtc_config": WEBRTC_CONFIG
         }
     except Exception as e:
         raise HTTPException(
@@ -81,7 +85,7 @@ async def log_prayer(
             "user_id": current_user.id,
             "user_name": current_user.name,
             "prayer_text": prayer_data["prayer_text"],
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.utcnow(),
             "session_id": prayer_data.get("session_id")
         }
     except Exception as e:
@@ -101,7 +105,7 @@ async def upload_decree(
             "id": "decree_456",
             "user_id": current_user.id,
             "decree_text": decree_data["decree_text"],
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.utcnow(),
             "type": decree_data.get("type", "prophetic_decree")
         }
     except Exception as e:
@@ -31,7 +31,7 @@ async def save_scroll_composition(
         return {
             "id": composition.id,
             "title": composition.title,
-            "created_at": composition.created_at.isoformat(),
+            "created_at": composition.created_at,
             "is_published": composition.is_published
         }
     except Exception as e:
@@ -1,141 +1,246 @@
-from fastapi import APIRouter, HTTPException, Depends, status
-from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
+from fastapi import APIRouter, HTTPException, Depends, Request, status
+from fastapi.responses import Response, ORJSONResponse
+from typing import List, Dict, Any, Optional, Tuple
+from datetime import datetime, time, timedelta
+import asyncio
+import hashlib
+import orjson
+from cachetools import TTLCache
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import select, func, desc, and_, or_
 
-from ..database import get_db
+from ..database import get_db, AsyncSessionLocal
+from ..cache import get_cached, set_cached, role_counts_cache, ROLE_COUNTS_KEY
 from ..auth import verify_token_and_role
-from ..models import User, Prophecy, ScrollCycle, PrayerRequest
-from ..schemas.scroll_dashboard import DashboardData, ProphecyItem, ScrollCycleItem
+from ..models import User, Prophecy, ScrollCycle, PrayerRequest, UrgencyEnum, StatusEnum, CycleStatusEnum
 
 router = APIRouter()
 
-@router.get("/", response_model=DashboardData)
+# Urgent prophecies: high urgency and still open
+URGENT_STATUSES = (StatusEnum.PENDING, StatusEnum.IN_PROGRESS)
+
+# Global aggregates change on human timescales; polling Elders share one cached copy per role
+DASHBOARD_CACHE_TTL_SECONDS = 30
+
+# Listing endpoints page with keyset cursors; a page never exceeds this many rows
+MAX_PAGE_SIZE = 200
+
+# Each worker also keeps the latest body per role with its ETag, so re-polls are answered
+# (usually with a 304) without Redis or the database, and without Redis configured at all
+_DASHBOARD_BODIES: TTLCache = TTLCache(maxsize=8, ttl=DASHBOARD_CACHE_TTL_SECONDS)
+
+def _remember_dashboard(role: str, body: bytes) -> Tuple[bytes, str]:
+    """Keep a dashboard body for the role in this worker, paired with a weak ETag of its bytes"""
+    entry = (body, f'W/"{hashlib.sha1(body).hexdigest()[:16]}"')
+    _DASHBOARD_BODIES[role] = entry
+    return entry
+
+def _dashboard_response(request: Request, body: bytes, etag: str) -> Response:
+    """Serve a dashboard body with its ETag, or 304 if the client already has it"""
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"private, max-age={DASHBOARD_CACHE_TTL_SECONDS}"
+    }
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+def _encode_cursor(created_at: datetime, row_id: int) -> str:
+    """Opaque keyset cursor pointing just past a (created_at, id) position"""
+    return f"{created_at.isoformat()}|{row_id}"
+
+def _decode_cursor(cursor: str):
+    """Parse a cursor from _encode_cursor, rejecting malformed input with 400"""
+    try:
+        created_at, row_id = cursor.rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(row_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+
+def _after_cursor(stmt, created_at_column, id_column, cursor: Optional[str]):
+    """Newest-first keyset page: rows strictly after the cursor, with id as the tiebreaker"""
+    if cursor:
+        last_created_at, last_id = _decode_cursor(cursor)
+        stmt = stmt.where(or_(
+            created_at_column < last_created_at,
+            and_(created_at_column == last_created_at, id_column < last_id)
+        ))
+    return stmt.order_by(desc(created_at_column), desc(id_column))
+
+async def _fetch_all(stmt):
+    """Run an ORM query on its own session so independent queries can overlap"""
+    async with AsyncSessionLocal() as session:
+        return (await session.execute(stmt)).unique().scalars().all()
+
+async def _fetch_rows(stmt):
+    """Run a row-returning query on its own session"""
+    async with AsyncSessionLocal() as session:
+        return (await session.execute(stmt)).all()
+
+async def _fetch_optional(stmt):
+    """Run a query for at most one ORM object on its own session"""
+    async with AsyncSessionLocal() as session:
+        return (await session.execute(stmt)).scalar_one_or_none()
+
+async def _fetch_one(stmt):
+    """Run a single-row query on its own session"""
+    async with AsyncSessionLocal() as session:
+        return (await session.execute(stmt)).one()
+
+async def _fetch_scalar(stmt):
+    """Run a single-value query on its own session"""
+    async with AsyncSessionLocal() as session:
+        return await session.scalar(stmt)
+
+async def _role_counts():
+    """(role, count) rows for all users, served from the in-process cache when fresh"""
+    rows = role_counts_cache.get(ROLE_COUNTS_KEY)
+    if rows is None:
+        rows = await _fetch_rows(select(User.role, func.count()).group_by(User.role))
+        role_counts_cache[ROLE_COUNTS_KEY] = rows
+    return rows
+
+def _count_by(rows, keys):
+    """
+    Turn (value, count) rows from a GROUP BY into counts zero-filled for the expected keys
+    Returns (counts, total) where total covers every row, including unexpected values
+    """
+    counts = dict.fromkeys(keys, 0)
+    total = 0
+    for value, count in rows:
+        total += count
+        key = getattr(value, "value", value)
+        if key in counts:
+            counts[key] = count
+    return counts, total
+
+def _prophecy_item(prophecy: Prophecy) -> Dict[str, Any]:
+    """Dashboard entry for a prophecy with its author loaded"""
+    user = prophecy.user
+    return {
+        "id": prophecy.id,
+        "message": prophecy.message,
+        "timestamp": prophecy.timestamp,
+        "urgency": prophecy.urgency,
+        "role": user.role if user else "Unknown",
+        "status": prophecy.status,
+        "user_id": prophecy.user_id,
+        "username": user.username if user else "Unknown"
+    }
+
+@router.get("/", response_class=ORJSONResponse)
 async def get_scroll_dashboard(
-    current_user: Dict = Depends(verify_token_and_role("Elder")),
-    db: Session = Depends(get_db)
+    request: Request,
+    current_user: Dict = Depends(verify_token_and_role("Elder"))
 ):
     """
     Get live dashboard data with prophetic cycles and assigned scrolls
     Access: Elder role required
     """
     try:
-        # Get recent prophecies
-        recent_prophecies = db.query(Prophecy).filter(
-            Prophecy.created_at >= datetime.utcnow() - timedelta(days=7)
-        ).order_by(desc(Prophecy.created_at)).limit(10).all()
+        # Keyed by role only: the payload is role-gated but contains nothing user-specific
+        role = current_user["role"]
+        remembered = _DASHBOARD_BODIES.get(role)
+        if remembered:
+            return _dashboard_response(request, *remembered)
         
-        # Format prophecies for response
-        prophecy_items = []
-        for prophecy in recent_prophecies:
-            user = db.query(User).filter(User.id == prophecy.user_id).first()
-            prophecy_items.append(
-                ProphecyItem(
-                    id=prophecy.id,
-                    message=prophecy.message,
-                    timestamp=prophecy.created_at,
-                    urgency=prophecy.urgency,
-                    role=user.role if user else "Unknown",
-                    status=prophecy.status,
-                    user_id=prophecy.user_id,
-                    username=user.username if user else "Unknown"
-                )
-            )
+        cache_key = f"scroll-dashboard:v1:{role}"
+        cached = await get_cached(cache_key)
+        if cached:
+            return _dashboard_response(request, *_remember_dashboard(role, cached))
         
-        # Get active scroll cycles
-        active_cycles = db.query(ScrollCycle).filter(
-            ScrollCycle.status == "active"
-        ).order_by(desc(ScrollCycle.created_at)).limit(5).all()
+        # The dashboard's queries are independent, so they run concurrently on separate sessions
+        now = datetime.utcnow()
+        # A datetime bound (not a date) so the comparison matches the column type and stays sargable
+        today_start = datetime.combine(now.date(), time.min)
+        (
+            recent_prophecies,
+            active_cycles,
+            role_rows,
+            status_rows,
+            active_cycles_count,
+            active_users_today
+        ) = await asyncio.gather(
+            # Recent prophecies
+            _fetch_all(
+                select(Prophecy).options(joinedload(Prophecy.user)).where(
+                    Prophecy.timestamp >= now - timedelta(days=7)
+                ).order_by(desc(Prophecy.timestamp)).limit(10)
+            ),
+            # Active scroll cycles
+            _fetch_all(
+                select(ScrollCycle).options(joinedload(ScrollCycle.creator)).where(
+                    ScrollCycle.status == CycleStatusEnum.ACTIVE
+                ).order_by(desc(ScrollCycle.created_at)).limit(5)
+            ),
+            # Role and prophecy status distributions, one grouped scan each
+            _role_counts(),
+            _fetch_rows(select(Prophecy.status, func.count()).group_by(Prophecy.status)),
+            # Active scroll cycles count
+            _fetch_scalar(select(func.count()).select_from(ScrollCycle).where(ScrollCycle.status == CycleStatusEnum.ACTIVE)),
+            # Users active today
+            _fetch_scalar(select(func.count()).select_from(User).where(User.last_login >= today_start))
+        )
+        
+        # Format prophecies for response
+        prophecy_items = [_prophecy_item(prophecy) for prophecy in recent_prophecies]
         
         # Format scroll cycles for response
         scroll_cycle_items = []
         for cycle in active_cycles:
-            user = db.query(User).filter(User.id == cycle.user_id).first()
-            scroll_cycle_items.append(
-                ScrollCycleItem(
-                    id=cycle.id,
-                    start_time=cycle.start_time,
-                    end_time=cycle.end_time,
-                    participants=cycle.participants,
-                    status=cycle.status,
-                    user_id=cycle.user_id,
-                    username=user.username if user else "Unknown",
-                    description=cycle.description
-                )
-            )
-        
-        # Get pending prophecies count
-        pending_prophecies = db.query(Prophecy).filter(
-            Prophecy.status == "Pending"
-        ).count()
-        
-        # Get active scroll cycles count
-        active_cycles_count = db.query(ScrollCycle).filter(
-            ScrollCycle.status == "active"
-        ).count()
-        
-        # Get recent prayer requests
-        recent_prayers = db.query(PrayerRequest).filter(
-            PrayerRequest.created_at >= datetime.utcnow() - timedelta(days=7)
-        ).order_by(desc(PrayerRequest.created_at)).limit(5).all()
+            user = cycle.creator
+            scroll_cycle_items.append({
+                "id": cycle.id,
+                "start_time": cycle.start_time,
+                "end_time": cycle.end_time,
+                "participants": cycle.participants,
+                "status": cycle.status,
+                "user_id": cycle.creator_id,
+                "username": user.username if user else "Unknown",
+                "description": cycle.description
+            })
         
-        # Get user statistics
-        total_users = db.query(User).count()
-        active_users_today = db.query(User).filter(
-            User.last_login >= datetime.utcnow().date()
-        ).count()
+        role_distribution, total_users = _count_by(role_rows, ("Deacon", "Elder", "Apostle", "Nation Seer"))
+        prophecy_status, _ = _count_by(status_rows, [prophecy_status.value for prophecy_status in StatusEnum])
         
-        # Get role distribution
-        role_distribution = {
-            "Deacon": db.query(User).filter(User.role == "Deacon").count(),
-            "Elder": db.query(User).filter(User.role == "Elder").count(),
-            "Apostle": db.query(User).filter(User.role == "Apostle").count(),
-            "Nation Seer": db.query(User).filter(User.role == "Nation Seer").count()
-        }
+        # Get pending prophecies count
+        pending_prophecies = prophecy_status[StatusEnum.PENDING.value]
         
-        # Get prophecy status distribution
-        prophecy_status = {
-            "Pending": db.query(Prophecy).filter(Prophecy.status == "Pending").count(),
-            "Active": db.query(Prophecy).filter(Prophecy.status == "Active").count(),
-            "Fulfilled": db.query(Prophecy).filter(Prophecy.status == "Fulfilled").count(),
-            "Archived": db.query(Prophecy).filter(Prophecy.status == "Archived").count()
-        }
+        # Urgent prophecies: the newest ones are usually already in the recent window. Any urgent
+        # prophecy newer than one found there would also be in it, so three hits there are the answer.
+        urgent_prophecies = [
+            prophecy for prophecy in recent_prophecies
+            if prophecy.urgency == UrgencyEnum.HIGH and prophecy.status in URGENT_STATUSES
+        ][:3]
+        if len(urgent_prophecies) < 3:
+            urgent_prophecies = await _fetch_all(
+                select(Prophecy).options(joinedload(Prophecy.user)).where(
+                    Prophecy.urgency == UrgencyEnum.HIGH,
+                    Prophecy.status.in_(URGENT_STATUSES)
+                ).order_by(desc(Prophecy.timestamp)).limit(3)
+            )
         
-        # Get urgent prophecies
-        urgent_prophecies = db.query(Prophecy).filter(
-            Prophecy.urgency == "High",
-            Prophecy.status.in_(["Pending", "Active"])
-        ).order_by(desc(Prophecy.created_at)).limit(3).all()
+        urgent_items = [_prophecy_item(prophecy) for prophecy in urgent_prophecies]
         
-        urgent_items = []
-        for prophecy in urgent_prophecies:
-            user = db.query(User).filter(User.id == prophecy.user_id).first()
-            urgent_items.append(
-                ProphecyItem(
-                    id=prophecy.id,
-                    message=prophecy.message,
-                    timestamp=prophecy.created_at,
-                    urgency=prophecy.urgency,
-                    role=user.role if user else "Unknown",
-                    status=prophecy.status,
-                    user_id=prophecy.user_id,
-                    username=user.username if user else "Unknown"
-                )
-            )
+        # Plain dict serialized by orjson: no response-model revalidation or jsonable_encoder pass
+        body = orjson.dumps({
+            "prophecies": prophecy_items,
+            "scroll_cycles": scroll_cycle_items,
+            "urgent_prophecies": urgent_items,
+            "pending_prophecies_count": pending_prophecies,
+            "active_cycles_count": active_cycles_count,
+            "total_users": total_users,
+            "active_users_today": active_users_today,
+            "role_distribution": role_distribution,
+            "prophecy_status": prophecy_status,
+            "last_updated": datetime.utcnow()
+        })
         
-        return DashboardData(
-            prophecies=prophecy_items,
-            scroll_cycles=scroll_cycle_items,
-            urgent_prophecies=urgent_items,
-            pending_prophecies_count=pending_prophecies,
-            active_cycles_count=active_cycles_count,
-            total_users=total_users,
-            active_users_today=active_users_today,
-            role_distribution=role_distribution,
-            prophecy_status=prophecy_status,
-            last_updated=datetime.utcnow()
-        )
+        await set_cached(cache_key, body, DASHBOARD_CACHE_TTL_SECONDS)
+        return _dashboard_response(request, *_remember_dashboard(role, body))
         
     except Exception as e:
         raise HTTPException(
@@ -147,43 +252,60 @@ async def get_scroll_dashboard(
 async def get_prophecies(
     limit: int = 20,
     status: Optional[str] = None,
+    cursor: Optional[str] = None,
     current_user: Dict = Depends(verify_token_and_role("Elder")),
     db: Session = Depends(get_db)
 ):
     """
-    Get prophecies with optional filtering
+    Get prophecies with optional filtering, newest first
+    Pass the returned next_cursor back as cursor to fetch the following page
     Access: Elder role required
     """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
     try:
-        query = db.query(Prophecy)
+        # Only the served columns, as plain rows: no ORM entities or identity map
+        query = db.query(
+            Prophecy.id,
+            Prophecy.message,
+            Prophecy.timestamp,
+            Prophecy.urgency,
+            Prophecy.status,
+            User.id.label("author_id"),
+            User.username,
+            User.role
+        ).outerjoin(User, User.id == Prophecy.user_id)
         
         if status:
             query = query.filter(Prophecy.status == status)
         
-        prophecies = query.order_by(desc(Prophecy.created_at)).limit(limit).all()
+        prophecies = _after_cursor(query, Prophecy.timestamp, Prophecy.id, cursor).limit(limit).all()
         
         prophecy_list = []
         for prophecy in prophecies:
-            user = db.query(User).filter(User.id == prophecy.user_id).first()
+            has_author = prophecy.author_id is not None
             prophecy_list.append({
                 "id": prophecy.id,
                 "message": prophecy.message,
-                "timestamp": prophecy.created_at,
+                "timestamp": prophecy.timestamp,
                 "urgency": prophecy.urgency,
                 "status": prophecy.status,
                 "user": {
-                    "id": user.id if user else None,
-                    "username": user.username if user else "Unknown",
-                    "role": user.role if user else "Unknown"
+                    "id": prophecy.author_id,
+                    "username": prophecy.username if has_author else "Unknown",
+                    "role": prophecy.role if has_author else "Unknown"
                 }
             })
         
+        last = prophecies[-1] if len(prophecies) == limit else None
         return {
             "prophecies": prophecy_list,
             "total": len(prophecy_list),
-            "status_filter": status
+            "status_filter": status,
+            "next_cursor": _encode_cursor(last.timestamp, last.id) if last else None
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -193,83 +315,113 @@ async def get_prophecies(
 @router.get("/scroll-cycles")
 async def get_scroll_cycles(
     status: Optional[str] = None,
-    current_user: Dict = Depends(verify_token_and_role("Elder")),
-    db: Session = Depends(get_db)
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    current_user: Dict = Depends(verify_token_and_role("Elder"))
 ):
     """
-    Get scroll cycles with optional filtering
+    Get scroll cycles with optional filtering, newest first
+    Pass the returned next_cursor back as cursor to fetch the following page
     Access: Elder role required
     """
-    try:
-        query = db.query(ScrollCycle)
-        
-        if status:
-            query = query.filter(ScrollCycle.status == status)
-        
-        cycles = query.order_by(desc(ScrollCycle.created_at)).all()
-        
-        cycle_list = []
-        for cycle in cycles:
-            user = db.query(User).filter(User.id == cycle.user_id).first()
-            cycle_list.append({
-                "id": cycle.id,
-                "start_time": cycle.start_time,
-                "end_time": cycle.end_time,
-                "participants": cycle.participants,
-                "status": cycle.status,
-                "description": cycle.description,
-                "user": {
-                    "id": user.id if user else None,
-                    "username": user.username if user else "Unknown",
-                    "role": user.role if user else "Unknown"
-                }
-            })
-        
-        return {
-            "scroll_cycles": cycle_list,
-            "total": len(cycle_list),
-            "status_filter": status
-        }
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve scroll cycles: {str(e)}"
-        )
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    # Only the served columns, as plain rows: no ORM entities or identity map
+    stmt = select(
+        ScrollCycle.id,
+        ScrollCycle.start_time,
+        ScrollCycle.end_time,
+        ScrollCycle.participants,
+        ScrollCycle.status,
+        ScrollCycle.description,
+        ScrollCycle.created_at,
+        User.id.label("author_id"),
+        User.username,
+        User.role
+    ).outerjoin(User, User.id == ScrollCycle.creator_id)
+    
+    if status:
+        stmt = stmt.where(ScrollCycle.status == status)
+    stmt = _after_cursor(stmt, ScrollCycle.created_at, ScrollCycle.id, cursor).limit(limit)
+    
+    # A page is at most MAX_PAGE_SIZE rows, so it is fetched in one go and serialized by orjson
+    cycles = await _fetch_rows(stmt)
+    
+    cycle_list = []
+    for cycle in cycles:
+        has_author = cycle.author_id is not None
+        cycle_list.append({
+            "id": cycle.id,
+            "start_time": cycle.start_time,
+            "end_time": cycle.end_time,
+            "participants": cycle.participants,
+            "status": cycle.status,
+            "description": cycle.description,
+            "user": {
+                "id": cycle.author_id,
+                "username": cycle.username if has_author else "Unknown",
+                "role": cycle.role if has_author else "Unknown"
+            }
+        })
+    
+    last = cycles[-1] if len(cycles) == limit else None
+    return {
+        "scroll_cycles": cycle_list,
+        "total": len(cycle_list),
+        "status_filter": status,
+        "next_cursor": _encode_cursor(last.created_at, last.id) if last else None
+    }
 
 @router.get("/user/{user_id}")
 async def get_user_dashboard(
     user_id: int,
-    current_user: Dict = Depends(verify_token_and_role("Elder")),
-    db: Session = Depends(get_db)
+    current_user: Dict = Depends(verify_token_and_role("Elder"))
 ):
     """
     Get dashboard data for a specific user
     Access: Elder role required
     """
     try:
-        user = db.query(User).filter(User.id == user_id).first()
+        # Statistics over all of the user's activity, aggregated in SQL in one round trip;
+        # each count is a scalar subquery so the outer SELECT has no FROM to cross-join
+        def user_count(model, owner_column, *criteria):
+            return select(func.count()).select_from(model).where(
+                owner_column == user_id, *criteria
+            ).scalar_subquery()
+        
+        # The user, their latest activity and the statistics are independent, so fetch them concurrently
+        user, user_prophecies, user_cycles, user_prayers, stats = await asyncio.gather(
+            _fetch_optional(select(User).where(User.id == user_id)),
+            # Get user's prophecies
+            _fetch_all(
+                select(Prophecy).where(Prophecy.user_id == user_id)
+                .order_by(desc(Prophecy.timestamp)).limit(10)
+            ),
+            # Get user's scroll cycles
+            _fetch_all(
+                select(ScrollCycle).where(ScrollCycle.creator_id == user_id)
+                .order_by(desc(ScrollCycle.created_at)).limit(5)
+            ),
+            # Get user's prayer requests
+            _fetch_all(
+                select(PrayerRequest).where(PrayerRequest.user_id == user_id)
+                .order_by(desc(PrayerRequest.created_at)).limit(5)
+            ),
+            _fetch_one(select(
+                user_count(Prophecy, Prophecy.user_id).label("total_prophecies"),
+                user_count(Prophecy, Prophecy.user_id, Prophecy.status == StatusEnum.PENDING).label("pending_prophecies"),
+                user_count(ScrollCycle, ScrollCycle.creator_id).label("total_cycles"),
+                user_count(
+                    ScrollCycle, ScrollCycle.creator_id, ScrollCycle.status == CycleStatusEnum.ACTIVE
+                ).label("active_cycles"),
+                user_count(PrayerRequest, PrayerRequest.user_id).label("total_prayers")
+            ))
+        )
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found"
             )
         
-        # Get user's prophecies
-        user_prophecies = db.query(Prophecy).filter(
-            Prophecy.user_id == user_id
-        ).order_by(desc(Prophecy.created_at)).limit(10).all()
-        
-        # Get user's scroll cycles
-        user_cycles = db.query(ScrollCycle).filter(
-            ScrollCycle.user_id == user_id
-        ).order_by(desc(ScrollCycle.created_at)).limit(5).all()
-        
-        # Get user's prayer requests
-        user_prayers = db.query(PrayerRequest).filter(
-            PrayerRequest.user_id == user_id
-        ).order_by(desc(PrayerRequest.created_at)).limit(5).all()
-        
         return {
             "user": {
                 "id": user.id,
@@ -283,7 +435,7 @@ async def get_user_dashboard(
                 {
                     "id": p.id,
                     "message": p.message,
-                    "timestamp": p.created_at,
+                    "timestamp": p.timestamp,
                     "urgency": p.urgency,
                     "status": p.status
                 } for p in user_prophecies
@@ -307,14 +459,16 @@ async def get_user_dashboard(
                 } for pr in user_prayers
             ],
             "statistics": {
-                "total_prophecies": len(user_prophecies),
-                "total_cycles": len(user_cycles),
-                "total_prayers": len(user_prayers),
-                "pending_prophecies": len([p for p in user_prophecies if p.status == "Pending"]),
-                "active_cycles": len([c for c in user_cycles if c.status == "active"])
+                "total_prophecies": stats.total_prophecies,
+                "total_cycles": stats.total_cycles,
+                "total_prayers": stats.total_prayers,
+                "pending_prophecies": stats.pending_prophecies,
+                "active_cycles": stats.active_cycles
             }
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
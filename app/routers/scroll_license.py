@@ -1,170 +1,189 @@
 from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
+from fastapi.responses import StreamingResponse
+from cachetools import TTLCache
 from sqlalchemy.orm import Session
-from typing import List, Optional
-import smtplib
-from email.mime.text import MimeText
-from email.mime.multipart import MimeMultipart
+from sqlalchemy import func, literal_column, select, union_all
+from typing import List, NamedTuple, Optional, Tuple
+import aiosmtplib
+from string import Template
+from email.mime.text import MIMEText
+from email.mime.multipart import MIMEMultipart
+import itertools
+import logging
+import orjson
 import os
 from datetime import datetime, timedelta
 import uuid
 
-from ..database import get_db
+from .. import smtp_pool
+from ..database import get_db, dialect_insert, SessionLocal
 from ..models.user import User
 from ..models.scroll_license import ScrollLicenseRequest
 from ..schemas.scroll_license import ScrollLicenseRequestCreate, ScrollLicenseRequestResponse
-from ..auth.firebase_auth import get_current_user
+from ..auth import require_apostle, require_nation_seer
 from ..config import settings
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/scroll-license", tags=["ScrollLicense"])
 
+# Request totals change slowly; admins refreshing /stats share one cached copy
+STATS_CACHE_TTL_SECONDS = 30
+_STATS_CACHE: TTLCache = TTLCache(maxsize=1, ttl=STATS_CACHE_TTL_SECONDS)
+_STATS_KEY = "stats"
+
+class ApostolicAccount(NamedTuple):
+    name: str
+    email: str
+    role: str
+    country: str
+    ministry: str
+    team_size: str
+    experience: str
+    purpose: str
+
 # Pre-filled apostolic accounts for launch
-APOSTOLIC_ACCOUNTS = [
-    {
-        "name": "Prophet Sarah Johnson",
-        "email": "sarah.johnson@churchos.app",
-        "role": "apostle",
-        "country": "us",
-        "ministry": "Global Prophetic Network",
-        "teamSize": "21-50",
-        "experience": "expert",
-        "purpose": "Leading apostolic network across North America"
-    },
-    {
-        "name": "Apostle Michael Chen",
-        "email": "michael.chen@churchos.app",
-        "role": "apostle",
-        "country": "ca",
-        "ministry": "Canadian Apostolic Alliance",
-        "teamSize": "51-100",
-        "experience": "expert",
-        "purpose": "Overseeing prophetic ministry across Canada"
-    },
-    {
-        "name": "Prophetess Rachel Williams",
-        "email": "rachel.williams@churchos.app",
-        "role": "prophet",
-        "country": "uk",
-        "ministry": "British Prophetic Council",
-        "teamSize": "21-50",
-        "experience": "advanced",
-        "purpose": "Prophetic oversight for UK churches"
-    },
-    {
-        "name": "Apostle David Okafor",
-        "email": "david.okafor@churchos.app",
-        "role": "apostle",
-        "country": "ng",
-        "ministry": "Nigerian Apostolic Network",
-        "teamSize": "100+",
-        "experience": "expert",
-        "purpose": "Leading apostolic movement across Nigeria"
-    },
-    {
-        "name": "Prophet Daniel Schmidt",
-        "email": "daniel.schmidt@churchos.app",
-        "role": "prophet",
-        "country": "de",
-        "ministry": "German Prophetic Ministry",
-        "teamSize": "6-20",
-        "experience": "advanced",
-        "purpose": "Prophetic ministry in German-speaking regions"
-    },
-    {
-        "name": "Apostle Marie Dubois",
-        "email": "marie.dubois@churchos.app",
-        "role": "apostle",
-        "country": "fr",
-        "ministry": "French Apostolic Alliance",
-        "teamSize": "21-50",
-        "experience": "expert",
-        "purpose": "Apostolic oversight for French-speaking churches"
-    },
-    {
-        "name": "Prophet Kwame Asante",
-        "email": "kwame.asante@churchos.app",
-        "role": "prophet",
-        "country": "gh",
-        "ministry": "Ghanaian Prophetic Council",
-        "teamSize": "51-100",
-        "experience": "advanced",
-        "purpose": "Prophetic ministry across Ghana"
-    },
-    {
-        "name": "Apostle Yosef Cohen",
-        "email": "yosef.cohen@churchos.app",
-        "role": "apostle",
-        "country": "il",
-        "ministry": "Israeli Apostolic Network",
-        "teamSize": "21-50",
-        "experience": "expert",
-        "purpose": "Apostolic oversight in Israel and Middle East"
-    },
-    {
-        "name": "Prophet Ahmed Al-Rashid",
-        "email": "ahmed.alrashid@churchos.app",
-        "role": "prophet",
-        "country": "sa",
-        "ministry": "Saudi Prophetic Ministry",
-        "teamSize": "6-20",
-        "experience": "advanced",
-        "purpose": "Prophetic ministry in Saudi Arabia"
-    },
-    {
-        "name": "Apostle Grace Thompson",
-        "email": "grace.thompson@churchos.app",
-        "role": "apostle",
-        "country": "au",
-        "ministry": "Australian Apostolic Alliance",
-        "teamSize": "21-50",
-        "experience": "expert",
-        "purpose": "Leading apostolic network across Australia"
-    },
-    {
-        "name": "Prophet Carlos Rodriguez",
-        "email": "carlos.rodriguez@churchos.app",
-        "role": "prophet",
-        "country": "us",
-        "ministry": "Hispanic Prophetic Network",
-        "teamSize": "51-100",
-        "experience": "advanced",
-        "purpose": "Prophetic ministry in Hispanic communities"
-    },
-    {
-        "name": "Apostle Elizabeth Kim",
-        "email": "elizabeth.kim@churchos.app",
-        "role": "apostle",
-        "country": "us",
-        "ministry": "Asian Apostolic Network",
-        "teamSize": "21-50",
-        "experience": "expert",
-        "purpose": "Apostolic oversight for Asian churches"
-    }
-]
+APOSTOLIC_ACCOUNTS: Tuple[ApostolicAccount, ...] = (
+    ApostolicAccount(
+        name="Prophet Sarah Johnson",
+        email="sarah.johnson@churchos.app",
+        role="apostle",
+        country="us",
+        ministry="Global Prophetic Network",
+        team_size="21-50",
+        experience="expert",
+        purpose="Leading apostolic network across North America"
+    ),
+    ApostolicAccount(
+        name="Apostle Michael Chen",
+        email="michael.chen@churchos.app",
+        role="apostle",
+        country="ca",
+        ministry="Canadian Apostolic Alliance",
+        team_size="51-100",
+        experience="expert",
+        purpose="Overseeing prophetic ministry across Canada"
+    ),
+    ApostolicAccount(
+        name="Prophetess Rachel Williams",
+        email="rachel.williams@churchos.app",
+        role="prophet",
+        country="uk",
+        ministry="British Prophetic Council",
+        team_size="21-50",
+        experience="advanced",
+        purpose="Prophetic oversight for UK churches"
+    ),
+    ApostolicAccount(
+        name="Apostle David Okafor",
+        email="david.okafor@churchos.app",
+        role="apostle",
+        country="ng",
+        ministry="Nigerian Apostolic Network",
+        team_size="100+",
+        experience="expert",
+        purpose="Leading apostolic movement across Nigeria"
+    ),
+    ApostolicAccount(
+        name="Prophet Daniel Schmidt",
+        email="daniel.schmidt@churchos.app",
+        role="prophet",
+        country="de",
+        ministry="German Prophetic Ministry",
+        team_size="6-20",
+        experience="advanced",
+        purpose="Prophetic ministry in German-speaking regions"
+    ),
+    ApostolicAccount(
+        name="Apostle Marie Dubois",
+        email="marie.dubois@churchos.app",
+        role="apostle",
+        country="fr",
+        ministry="French Apostolic Alliance",
+        team_size="21-50",
+        experience="expert",
+        purpose="Apostolic oversight for French-speaking churches"
+    ),
+    ApostolicAccount(
+        name="Prophet Kwame Asante",
+        email="kwame.asante@churchos.app",
+        role="prophet",
+        country="gh",
+        ministry="Ghanaian Prophetic Council",
+        team_size="51-100",
+        experience="advanced",
+        purpose="Prophetic ministry across Ghana"
+    ),
+    ApostolicAccount(
+        name="Apostle Yosef Cohen",
+        email="yosef.cohen@churchos.app",
+        role="apostle",
+        country="il",
+        ministry="Israeli Apostolic Network",
+        team_size="21-50",
+        experience="expert",
+        purpose="Apostolic oversight in Israel and Middle East"
+    ),
+    ApostolicAccount(
+        name="Prophet Ahmed Al-Rashid",
+        email="ahmed.alrashid@churchos.app",
+        role="prophet",
+        country="sa",
+        ministry="Saudi Prophetic Ministry",
+        team_size="6-20",
+        experience="advanced",
+        purpose="Prophetic ministry in Saudi Arabia"
+    ),
+    ApostolicAccount(
+        name="Apostle Grace Thompson",
+        email="grace.thompson@churchos.app",
+        role="apostle",
+        country="au",
+        ministry="Australian Apostolic Alliance",
+        team_size="21-50",
+        experience="expert",
+        purpose="Leading apostolic network across Australia"
+    ),
+    ApostolicAccount(
+        name="Prophet Carlos Rodriguez",
+        email="carlos.rodriguez@churchos.app",
+        role="prophet",
+        country="us",
+        ministry="Hispanic Prophetic Network",
+        team_size="51-100",
+        experience="advanced",
+        purpose="Prophetic ministry in Hispanic communities"
+    ),
+    ApostolicAccount(
+        name="Apostle Elizabeth Kim",
+        email="elizabeth.kim@churchos.app",
+        role="apostle",
+        country="us",
+        ministry="Asian Apostolic Network",
+        team_size="21-50",
+        experience="expert",
+        purpose="Apostolic oversight for Asian churches"
+    )
+)
 
-def send_scroll_invite_email(email: str, name: str, role: str, access_link: str):
-    """Send ScrollInvite email with sacred onboarding instructions"""
-    
-    # Email template based on role
-    if role in ["apostle", "prophet"]:
-        template = "apostolic_leader"
-    elif role == "intercessor":
-        template = "intercessor"
-    else:
-        template = "general"
-    
-    # Sacred email content
-    subject = "🕊️ Sacred Invitation: Join CHURCHOS™ for Prophetic Church Governance"
-    
-    body = f"""
-Dear {name},
+ACTIVATION_URL = "https://churchos.app/activate/"
+
+# Sender address when no SMTP user is configured
+INVITE_SENDER = "team@churchos.app"
+
+INVITE_SUBJECT = "🕊️ Sacred Invitation: Join CHURCHOS™ for Prophetic Church Governance"
+
+# Sacred email content, compiled once; $role is the title-cased role name
+_INVITE_BODY = Template("""
+Dear $name,
 
 "For the word of God is living and active, sharper than any two-edged sword." - Hebrews 4:12
 
 We are honored to extend a sacred invitation for your ministry to experience CHURCHOS™ - the scroll-certified operating system for prophetic church governance.
 
 **Your Sacred Access:**
-- Role: {role.title()}
-- Access Link: {access_link}
+- Role: $role
+- Access Link: $access_link
 - Training Guide: https://docs.churchos.app/scrollguide
 
 **Next Steps:**
@@ -201,21 +220,123 @@ Govern the Church with CHURCHOS. The future is scroll.
 
 Blessings,
 The CHURCHOS™ Team
-    """
+    """)
+
+# Every template shares one body for now; give a key its own Template to specialise it
+_BODIES = {
+    "apostolic_leader": _INVITE_BODY,
+    "intercessor": _INVITE_BODY,
+    "general": _INVITE_BODY
+}
+
+# Email template based on role, anything unlisted gets "general"
+_TEMPLATE_BY_ROLE = {
+    "apostle": "apostolic_leader",
+    "prophet": "apostolic_leader",
+    "intercessor": "intercessor"
+}
+
+def render_scroll_invite(name: str, role: str, access_link: str) -> Tuple[str, str]:
+    """Build the ScrollInvite subject and body with sacred onboarding instructions"""
+    template = _BODIES[_TEMPLATE_BY_ROLE.get(role, "general")]
+    body = template.substitute(name=name, role=role.title(), access_link=access_link)
+    return INVITE_SUBJECT, body
+
+def _invite_message(sender: str) -> Tuple[MIMEMultipart, MIMEText]:
+    """Build the invite message once per batch; the sender fills in To and the body per recipient"""
+    message = MIMEMultipart()
+    message["From"] = sender
+    message["To"] = ""
+    message["Subject"] = INVITE_SUBJECT
+    body_part = MIMEText("", "plain", "utf-8")
+    message.attach(body_part)
+    return message, body_part
+
+def _set_invite_body(body_part: MIMEText, body: str):
+    """Swap in a recipient's body, re-encoding it for the part's charset"""
+    del body_part["Content-Transfer-Encoding"]
+    body_part.set_payload(body, "utf-8")
+
+async def send_scroll_invite_batch(recipients: List[Tuple[str, str, str, str]]):
+    """Send ScrollInvite emails to (email, name, role, access_token) recipients over one pooled SMTP session"""
     
-    # Send email (implement with your email service)
+    if not settings.smtp_host:
+        # No mail server configured, just log the emails
+        if logger.isEnabledFor(logging.DEBUG):
+            for email, name, role, access_token in recipients:
+                subject, body = render_scroll_invite(name, role, ACTIVATION_URL + access_token)
+                logger.debug("ScrollInvite to %s subject=%s bytes=%d", email, subject, len(body))
+        return
+    
+    sender = settings.smtp_user or INVITE_SENDER
+    message, body_part = _invite_message(sender)
+    attempted = 0
     try:
-        # Configure your email service here
-        # For now, we'll just log the email
-        print(f"Sending ScrollInvite email to {email}")
-        print(f"Subject: {subject}")
-        print(f"Body: {body}")
-        
-        # TODO: Implement actual email sending
-        # send_email(email, subject, body)
-        
-    except Exception as e:
-        print(f"Failed to send email to {email}: {e}")
+        async with smtp_pool.acquire() as smtp:
+            for email, name, role, access_token in recipients:
+                attempted += 1
+                _, body = render_scroll_invite(name, role, ACTIVATION_URL + access_token)
+                message.replace_header("To", email)
+                _set_invite_body(body_part, body)
+                try:
+                    await smtp.sendmail(sender, [email], message.as_string())
+                except (aiosmtplib.SMTPException, OSError) as e:
+                    logger.error("Failed to send email to %s: %s", email, e)
+                    # Reset the half-open transaction so the failed recipient can't affect the next
+                    # one; if the server dropped the session, reconnect and carry on
+                    try:
+                        await smtp.rset()
+                    except (aiosmtplib.SMTPException, OSError):
+                        await smtp.close()
+                        await smtp.ensure_connected()
+    except (aiosmtplib.SMTPException, OSError) as e:
+        skipped = [email for email, _, _, _ in recipients[attempted:]]
+        logger.error(
+            "ScrollInvite batch failed after %d of %d emails, skipped %s: %s",
+            attempted, len(recipients), ", ".join(skipped) or "none", e
+        )
+
+async def send_scroll_invite_email(email: str, name: str, role: str, access_token: str):
+    """Send a single ScrollInvite email"""
+    await send_scroll_invite_batch([(email, name, role, access_token)])
+
+# Role and country distributions in one round-trip, each row tagged with its dimension
+_DISTRIBUTIONS = union_all(
+    select(
+        literal_column("'role'").label("dimension"),
+        ScrollLicenseRequest.role.label("key"),
+        func.count().label("count")
+    ).group_by(ScrollLicenseRequest.role),
+    select(
+        literal_column("'country'"),
+        ScrollLicenseRequest.country,
+        func.count()
+    ).group_by(ScrollLicenseRequest.country)
+)
+
+def _license_stats(db: Session) -> dict:
+    """Compute request totals and distributions in two round-trips"""
+    
+    status_counts = {}
+    for status, count in db.execute(
+        select(ScrollLicenseRequest.status, func.count()).group_by(ScrollLicenseRequest.status)
+    ):
+        status_counts[getattr(status, "value", status)] = count
+    
+    role_distribution = {}
+    country_distribution = {}
+    buckets = {"role": role_distribution, "country": country_distribution}
+    for dimension, key, count in db.execute(_DISTRIBUTIONS):
+        buckets[dimension][key] = count
+    
+    return {
+        "total_requests": sum(status_counts.values()),
+        "pending_requests": status_counts.get("pending", 0),
+        "approved_requests": status_counts.get("approved", 0),
+        "role_distribution": role_distribution,
+        "country_distribution": country_distribution,
+        "apostolic_accounts": len(APOSTOLIC_ACCOUNTS)
+    }
 
 @router.post("/request", response_model=ScrollLicenseRequestResponse)
 async def request_scroll_license(
@@ -230,27 +351,32 @@ async def request_scroll_license(
     if existing_user:
         raise HTTPException(status_code=400, detail="Email already registered")
     
-    # Create ScrollLicense request
-    db_request = ScrollLicenseRequest(
-        name=request.name,
-        email=request.email,
-        role=request.role,
-        purpose=request.purpose,
-        country=request.country,
-        ministry=request.ministry,
-        team_size=request.teamSize,
-        experience=request.experience,
-        status="pending",
-        created_at=datetime.utcnow()
-    )
-    
-    db.add(db_request)
+    # Create ScrollLicense request with its activation token; a concurrent or repeated
+    # request for the same email inserts nothing
+    access_token = uuid.uuid4().hex
+    db_request = db.execute(
+        dialect_insert(ScrollLicenseRequest)
+        .values(
+            name=request.name,
+            email=request.email,
+            role=request.role,
+            purpose=request.purpose,
+            country=request.country,
+            ministry=request.ministry,
+            team_size=request.team_size,
+            experience=request.experience,
+            status="pending",
+            access_token=access_token,
+            created_at=datetime.utcnow()
+        )
+        .on_conflict_do_nothing(index_elements=["email"])
+        .returning(ScrollLicenseRequest.id, ScrollLicenseRequest.status, ScrollLicenseRequest.created_at)
+    ).first()
     db.commit()
-    db.refresh(db_request)
     
-    # Generate access link
-    access_token = str(uuid.uuid4())
-    access_link = f"https://churchos.app/activate/{access_token}"
+    if db_request is None:
+        raise HTTPException(status_code=400, detail="ScrollLicense already requested for this email")
+    _STATS_CACHE.clear()
     
     # Send ScrollInvite email in background
     background_tasks.add_task(
@@ -258,31 +384,62 @@ async def request_scroll_license(
         request.email,
         request.name,
         request.role,
-        access_link
+        access_token
     )
     
     return ScrollLicenseRequestResponse(
         id=db_request.id,
-        name=db_request.name,
-        email=db_request.email,
-        role=db_request.role,
+        name=request.name,
+        email=request.email,
+        role=request.role,
         status=db_request.status,
         created_at=db_request.created_at,
         message="Sacred request submitted successfully. Check your email for access instructions."
     )
 
-@router.get("/requests", response_model=List[ScrollLicenseRequestResponse])
-async def get_scroll_license_requests(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+def _stream_license_requests():
+    """
+    Yield every ScrollLicense request as a JSON array, one row at a time
+    Rows come off a server-side cursor, so neither the rows nor the body are held in memory.
+    The opening bracket is only yielded once the query has run and its first row is in hand.
+    """
+    stmt = select(
+        ScrollLicenseRequest.id,
+        ScrollLicenseRequest.name,
+        ScrollLicenseRequest.email,
+        ScrollLicenseRequest.role,
+        ScrollLicenseRequest.status,
+        ScrollLicenseRequest.created_at
+    ).order_by(ScrollLicenseRequest.created_at.desc())
+    
+    # The request's session is closed once streaming starts, so the generator owns its own
+    with SessionLocal() as session:
+        rows = iter(session.execute(stmt.execution_options(stream_results=True, yield_per=500)))
+        row = next(rows, None)
+        yield b"["
+        first = True
+        for row in itertools.chain([row] if row is not None else [], rows):
+            yield (b"" if first else b",") + orjson.dumps({
+                "id": row.id,
+                "name": row.name,
+                "email": row.email,
+                "role": row.role,
+                "status": row.status,
+                "created_at": row.created_at
+            })
+            first = False
+        yield b"]"
+
+@router.get("/requests", responses={200: {"model": List[ScrollLicenseRequestResponse]}})
+def get_scroll_license_requests(
+    current_user: User = Depends(require_apostle)
 ):
     """Get all ScrollLicense requests (EXOUSIA role required)"""
     
-    if current_user.role not in ["apostle", "nation_seer"]:
-        raise HTTPException(status_code=403, detail="Insufficient EXOUSIA level")
-    
-    requests = db.query(ScrollLicenseRequest).order_by(ScrollLicenseRequest.created_at.desc()).all()
-    return requests
+    # Start the stream here so a failing query surfaces as an error status, not a truncated 200
+    body = _stream_license_requests()
+    head = next(body)
+    return StreamingResponse(itertools.chain([head], body), media_type="application/json")
 
 @router.post("/activate/{token}")
 async def activate_scroll_license(
@@ -310,54 +467,46 @@ async def activate_scroll_license(
 
 @router.post("/seed-apostolic-accounts")
 async def seed_apostolic_accounts(
-    current_user: User = Depends(get_current_user),
     background_tasks: BackgroundTasks,
+    current_user: User = Depends(require_nation_seer),
     db: Session = Depends(get_db)
 ):
     """Seed pre-filled apostolic accounts for launch (Admin only)"""
     
-    if current_user.role != "nation_seer":
-        raise HTTPException(status_code=403, detail="Nation Seer access required")
-    
-    created_requests = []
+    # One timestamp for the whole seed batch
+    now = datetime.utcnow()
+    rows = [
+        {
+            **account._asdict(),
+            "status": "approved",
+            "access_token": uuid.uuid4().hex,
+            "created_at": now
+        }
+        for account in APOSTOLIC_ACCOUNTS
+    ]
     
-    for account in APOSTOLIC_ACCOUNTS:
-        # Check if account already exists
-        existing = db.query(ScrollLicenseRequest).filter(
-            ScrollLicenseRequest.email == account["email"]
-        ).first()
-        
-        if not existing:
-            # Create ScrollLicense request
-            db_request = ScrollLicenseRequest(
-                name=account["name"],
-                email=account["email"],
-                role=account["role"],
-                purpose=account["purpose"],
-                country=account["country"],
-                ministry=account["ministry"],
-                team_size=account["teamSize"],
-                experience=account["experience"],
-                status="approved",
-                created_at=datetime.utcnow()
-            )
-            
-            db.add(db_request)
-            created_requests.append(db_request)
+    # Create the missing ScrollLicense requests in a single executemany; already-seeded emails are skipped
+    created_requests = db.execute(
+        dialect_insert(ScrollLicenseRequest)
+        .on_conflict_do_nothing(index_elements=["email"])
+        .returning(
+            ScrollLicenseRequest.id,
+            ScrollLicenseRequest.email,
+            ScrollLicenseRequest.name,
+            ScrollLicenseRequest.role,
+            ScrollLicenseRequest.access_token
+        ),
+        rows
+    ).all()
     
     db.commit()
+    _STATS_CACHE.clear()
     
-    # Send ScrollInvite emails in background
-    for request in created_requests:
-        access_token = str(uuid.uuid4())
-        access_link = f"https://churchos.app/activate/{access_token}"
-        
+    # Send ScrollInvite emails in background over a single SMTP session
+    if created_requests:
         background_tasks.add_task(
-            send_scroll_invite_email,
-            request.email,
-            request.name,
-            request.role,
-            access_link
+            send_scroll_invite_batch,
+            [(row.email, row.name, row.role, row.access_token) for row in created_requests]
         )
     
     return {
@@ -368,39 +517,13 @@ async def seed_apostolic_accounts(
 
 @router.get("/stats")
 async def get_scroll_license_stats(
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(require_apostle),
     db: Session = Depends(get_db)
 ):
     """Get ScrollLicense statistics (EXOUSIA role required)"""
     
-    if current_user.role not in ["apostle", "nation_seer"]:
-        raise HTTPException(status_code=403, detail="Insufficient EXOUSIA level")
-    
-    total_requests = db.query(ScrollLicenseRequest).count()
-    pending_requests = db.query(ScrollLicenseRequest).filter(
-        ScrollLicenseRequest.status == "pending"
-    ).count()
-    approved_requests = db.query(ScrollLicenseRequest).filter(
-        ScrollLicenseRequest.status == "approved"
-    ).count()
-    
-    # Role distribution
-    role_stats = db.query(
-        ScrollLicenseRequest.role,
-        db.func.count(ScrollLicenseRequest.id)
-    ).group_by(ScrollLicenseRequest.role).all()
-    
-    # Country distribution
-    country_stats = db.query(
-        ScrollLicenseRequest.country,
-        db.func.count(ScrollLicenseRequest.id)
-    ).group_by(ScrollLicenseRequest.country).all()
-    
-    return {
-        "total_requests": total_requests,
-        "pending_requests": pending_requests,
-        "approved_requests": approved_requests,
-        "role_distribution": dict(role_stats),
-        "country_distribution": dict(country_stats),
-        "apostolic_accounts": len(APOSTOLIC_ACCOUNTS)
-    } 
\ No newline at end of file
+    stats = _STATS_CACHE.get(_STATS_KEY)
+    if stats is None:
+        stats = _license_stats(db)
+        _STATS_CACHE[_STATS_KEY] = stats
+    return stats
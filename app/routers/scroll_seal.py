@@ -1,51 +1,85 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 from typing import Dict, Any, List
 from datetime import datetime
 import logging
+import orjson
 
 from ..database import get_db
 from ..models import User, RoleEnum
-from ..auth import get_current_user, require_role, require_apostle, require_nation_seer
+from ..auth import get_current_user, require_role, require_apostle, require_nation_seer, invalidate_cached_user
+from ..cache import invalidate_role_counts
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-def verify_token_and_role(required_role: RoleEnum):
-    """Verify token and check role permission for sacred access"""
-    def role_checker(current_user: User = Depends(get_current_user)):
-        if not current_user:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Sacred authentication required"
-            )
-        
-        # Check role hierarchy
-        role_hierarchy = {
-            RoleEnum.DEACON: 1,
-            RoleEnum.ELDER: 2,
-            RoleEnum.APOSTLE: 3,
-            RoleEnum.NATION_SEER: 4
+# Permission sets per EXOUSIA role, as reported by the seal endpoints
+ROLE_PERMISSIONS = {
+    RoleEnum.DEACON: [
+        "view_prophecies",
+        "create_basic_prophecies",
+        "join_prayer_sessions"
+    ],
+    RoleEnum.ELDER: [
+        "view_prophecies",
+        "create_prophecies",
+        "manage_prayer_sessions",
+        "access_bible_characters",
+        "view_holy_land"
+    ],
+    RoleEnum.APOSTLE: [
+        "view_prophecies",
+        "create_prophecies",
+        "manage_prayer_sessions",
+        "access_bible_characters",
+        "view_holy_land",
+        "create_scroll_compositions",
+        "manage_users",
+        "start_livestreams",
+        "scroll_seal_access"
+    ],
+    RoleEnum.NATION_SEER: [
+        "view_prophecies",
+        "create_prophecies",
+        "manage_prayer_sessions",
+        "access_bible_characters",
+        "view_holy_land",
+        "create_scroll_compositions",
+        "manage_users",
+        "start_livestreams",
+        "manage_roles",
+        "access_all_modules",
+        "prophetic_oversight",
+        "scroll_seal_access",
+        "nation_wide_authority"
+    ]
+}
+
+ROLE_DESCRIPTIONS = {
+    RoleEnum.DEACON: "Basic scroll access for consecrated believers",
+    RoleEnum.ELDER: "Enhanced scroll access with biblical character interaction",
+    RoleEnum.APOSTLE: "Full scroll authority with user management capabilities",
+    RoleEnum.NATION_SEER: "Supreme scroll authority with prophetic oversight"
+}
+
+# Roles are fixed, so the /roles body is serialized once at import
+ROLES_JSON = orjson.dumps({
+    "roles": [
+        {
+            "name": role.value,
+            "level": role.level,
+            "permissions": ROLE_PERMISSIONS[role],
+            "description": ROLE_DESCRIPTIONS[role]
         }
-        
-        user_level = role_hierarchy.get(current_user.role, 0)
-        required_level = role_hierarchy.get(required_role, 0)
-        
-        if user_level < required_level:
-            logger.warning(f"Access denied: {current_user.name} tried to access {required_role.value} endpoint")
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Insufficient EXOUSIA. Required role: {required_role.value}. Your role: {current_user.role.value}"
-            )
-        
-        return current_user
-    return role_checker
+        for role in RoleEnum
+    ]
+})
 
 @router.get("/scroll-seal")
 async def get_scroll_seal_access(
-    current_user: User = Depends(verify_token_and_role(RoleEnum.APOSTLE))
+    current_user: User = Depends(require_apostle)
 ):
     """Get scroll seal access confirmation for sacred operations"""
     try:
@@ -57,7 +91,7 @@ async def get_scroll_seal_access(
             "user_name": current_user.name,
             "role": current_user.role.value,
             "seal_level": "APOSTLE",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.utcnow(),
             "message": "Sacred scroll seal access confirmed. You have authority to perform sacred operations."
         }
     except HTTPException:
@@ -75,70 +109,9 @@ async def get_roles(
 ):
     """Get available EXOUSIA roles and their sacred permissions"""
     try:
-        roles = [
-            {
-                "name": "Deacon",
-                "level": 1,
-                "permissions": [
-                    "view_prophecies",
-                    "create_basic_prophecies",
-                    "join_prayer_sessions"
-                ],
-                "description": "Basic scroll access for consecrated believers"
-            },
-            {
-                "name": "Elder",
-                "level": 2,
-                "permissions": [
-                    "view_prophecies",
-                    "create_prophecies",
-                    "manage_prayer_sessions",
-                    "access_bible_characters",
-                    "view_holy_land"
-                ],
-                "description": "Enhanced scroll access with biblical character interaction"
-            },
-            {
-                "name": "Apostle",
-                "level": 3,
-                "permissions": [
-                    "view_prophecies",
-                    "create_prophecies",
-                    "manage_prayer_sessions",
-                    "access_bible_characters",
-                    "view_holy_land",
-                    "create_scroll_compositions",
-                    "manage_users",
-                    "start_livestreams",
-                    "scroll_seal_access"
-                ],
-                "description": "Full scroll authority with user management capabilities"
-            },
-            {
-                "name": "Nation Seer",
-                "level": 4,
-                "permissions": [
-                    "view_prophecies",
-                    "create_prophecies",
-                    "manage_prayer_sessions",
-                    "access_bible_characters",
-                    "view_holy_land",
-                    "create_scroll_compositions",
-                    "manage_users",
-                    "start_livestreams",
-                    "manage_roles",
-                    "access_all_modules",
-                    "prophetic_oversight",
-                    "scroll_seal_access",
-                    "nation_wide_authority"
-                ],
-                "description": "Supreme scroll authority with prophetic oversight"
-            }
-        ]
-        
         logger.info(f"User {current_user.name} accessed role information")
         
-        return {"roles": roles}
+        return Response(content=ROLES_JSON, media_type="application/json")
     except Exception as e:
         logger.error(f"Error fetching roles: {str(e)}")
         raise HTTPException(
@@ -149,7 +122,7 @@ async def get_roles(
 @router.post("/assign-role")
 async def assign_role(
     role_data: Dict[str, Any],
-    current_user: User = Depends(require_apostle()),
+    current_user: User = Depends(require_apostle),
     db: Session = Depends(get_db)
 ):
     """Assign a sacred role to a user (requires Apostle or higher)"""
@@ -181,17 +154,7 @@ async def assign_role(
             )
         
         # Check if current user has authority to assign this role
-        role_hierarchy = {
-            RoleEnum.DEACON: 1,
-            RoleEnum.ELDER: 2,
-            RoleEnum.APOSTLE: 3,
-            RoleEnum.NATION_SEER: 4
-        }
-        
-        current_user_level = role_hierarchy.get(current_user.role, 0)
-        new_role_level = role_hierarchy.get(new_role, 0)
-        
-        if current_user_level <= new_role_level:
+        if current_user.role_level <= new_role.level:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="You can only assign roles lower than your own"
@@ -201,6 +164,9 @@ async def assign_role(
         old_role = user.role
         user.role = new_role
         db.commit()
+        # Both caches are per worker: other workers see the new role within USER_CACHE_TTL_SECONDS
+        invalidate_cached_user(user.firebase_uid)
+        invalidate_role_counts()
         
         logger.info(f"User {current_user.name} assigned role {new_role.value} to {user.name}")
         
@@ -210,7 +176,7 @@ async def assign_role(
             "old_role": old_role.value,
             "new_role": new_role.value,
             "assigned_by": current_user.name,
-            "assigned_at": datetime.utcnow().isoformat(),
+            "assigned_at": datetime.utcnow(),
             "message": f"Sacred role {new_role.value} assigned successfully"
         }
     except HTTPException:
@@ -228,59 +194,18 @@ async def get_my_permissions(
 ):
     """Get current user's sacred permissions based on EXOUSIA role"""
     try:
-        permissions_map = {
-            RoleEnum.DEACON: [
-                "view_prophecies",
-                "create_basic_prophecies",
-                "join_prayer_sessions"
-            ],
-            RoleEnum.ELDER: [
-                "view_prophecies",
-                "create_prophecies",
-                "manage_prayer_sessions",
-                "access_bible_characters",
-                "view_holy_land"
-            ],
-            RoleEnum.APOSTLE: [
-                "view_prophecies",
-                "create_prophecies",
-                "manage_prayer_sessions",
-                "access_bible_characters",
-                "view_holy_land",
-                "create_scroll_compositions",
-                "manage_users",
-                "start_livestreams",
-                "scroll_seal_access"
-            ],
-            RoleEnum.NATION_SEER: [
-                "view_prophecies",
-                "create_prophecies",
-                "manage_prayer_sessions",
-                "access_bible_characters",
-                "view_holy_land",
-                "create_scroll_compositions",
-                "manage_users",
-                "start_livestreams",
-                "manage_roles",
-                "access_all_modules",
-                "prophetic_oversight",
-                "scroll_seal_access",
-                "nation_wide_authority"
-            ]
-        }
-        
-        user_permissions = permissions_map.get(current_user.role, [])
+        user_permissions = ROLE_PERMISSIONS.get(current_user.role, [])
         
         logger.info(f"User {current_user.name} checked their permissions")
         
-        return {
+        return Response(content=orjson.dumps({
             "user_id": current_user.id,
             "user_name": current_user.name,
             "role": current_user.role.value,
             "permissions": user_permissions,
             "permission_count": len(user_permissions),
-            "timestamp": datetime.utcnow().isoformat()
-        }
+            "timestamp": datetime.utcnow()
+        }), media_type="application/json")
     except Exception as e:
         logger.error(f"Error fetching permissions: {str(e)}")
         raise HTTPException(
@@ -290,7 +215,7 @@ async def get_my_permissions(
 
 @router.get("/seal-status")
 async def get_seal_status(
-    current_user: User = Depends(require_nation_seer())
+    current_user: User = Depends(require_nation_seer)
 ):
     """Get sacred scroll seal status (Nation Seer only)"""
     try:
@@ -301,7 +226,7 @@ async def get_seal_status(
             "seal_level": "NATION_SEER",
             "user_id": current_user.id,
             "user_name": current_user.name,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.utcnow(),
             "message": "Sacred scroll seal is active and under prophetic oversight"
         }
     except HTTPException:
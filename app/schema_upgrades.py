@@ -0,0 +1,17 @@
+import logging
+
+from sqlalchemy import text
+
+from .database import async_engine
+from .models import USERS_ROLE_LEVEL_DDL
+
+logger = logging.getLogger(__name__)
+
+async def apply() -> None:
+    """Bring an existing PostgreSQL schema up to date with columns and indexes added since it was created"""
+    if async_engine.dialect.name != "postgresql":
+        return
+    async with async_engine.begin() as conn:
+        for statement in USERS_ROLE_LEVEL_DDL:
+            await conn.execute(text(statement))
+    logger.info("Schema upgrades applied")
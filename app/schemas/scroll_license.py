@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 from typing import Optional
 from datetime import datetime
 from enum import Enum
@@ -10,17 +10,9 @@ class RequestStatus(str, Enum):
     ACTIVATED = "activated"
 
 class ScrollLicenseRequestCreate(BaseModel):
-    name: str
-    email: EmailStr
-    role: str
-    purpose: str
-    country: str
-    ministry: str
-    teamSize: str
-    experience: str
-
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        populate_by_name=True,
+        json_schema_extra={
             "example": {
                 "name": "Prophet Sarah Johnson",
                 "email": "sarah.johnson@churchos.app",
@@ -32,8 +24,20 @@ class ScrollLicenseRequestCreate(BaseModel):
                 "experience": "expert"
             }
         }
+    )
+
+    name: str
+    email: EmailStr
+    role: str
+    purpose: str
+    country: str
+    ministry: str
+    team_size: str = Field(alias="teamSize")
+    experience: str
 
 class ScrollLicenseRequestResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     name: str
     email: str
@@ -42,9 +46,6 @@ class ScrollLicenseRequestResponse(BaseModel):
     created_at: datetime
     message: str
 
-    class Config:
-        from_attributes = True
-
 class ScrollLicenseStats(BaseModel):
     total_requests: int
     pending_requests: int
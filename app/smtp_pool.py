@@ -0,0 +1,103 @@
+import asyncio
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, List, Optional
+
+import aiosmtplib
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+# At most this many open SMTP sessions per process
+POOL_MAX_CONNECTIONS = 5
+
+# Retire a session after this many messages so long-lived connections get recycled
+MAX_MESSAGES_PER_CONNECTION = 100
+
+SMTP_TIMEOUT_SECONDS = 30
+
+# Port 465 speaks TLS from the first byte (SMTPS); other ports upgrade with STARTTLS
+SMTPS_PORT = 465
+
+class SMTPConnection:
+    """An authenticated SMTP session that reconnects lazily when the server drops it"""
+
+    def __init__(self):
+        self._smtp: Optional[aiosmtplib.SMTP] = None
+        self.messages_sent = 0
+
+    async def _connect(self) -> None:
+        implicit_tls = settings.smtp_port == SMTPS_PORT
+        smtp = aiosmtplib.SMTP(
+            hostname=settings.smtp_host,
+            port=settings.smtp_port,
+            use_tls=implicit_tls,
+            start_tls=not implicit_tls,
+            timeout=SMTP_TIMEOUT_SECONDS
+        )
+        await smtp.connect()
+        if settings.smtp_user:
+            await smtp.login(settings.smtp_user, settings.smtp_password)
+        self._smtp = smtp
+        self.messages_sent = 0
+
+    async def ensure_connected(self) -> None:
+        """Open the session, or check an idle one with NOOP and reopen it if the server hung up"""
+        if self._smtp is None:
+            await self._connect()
+            return
+        try:
+            await self._smtp.noop()
+        except (aiosmtplib.SMTPServerDisconnected, OSError):
+            await self.close()
+            await self._connect()
+
+    async def sendmail(self, sender: str, recipients: List[str], message: str) -> None:
+        await self._smtp.sendmail(sender, recipients, message)
+        self.messages_sent += 1
+
+    async def rset(self) -> None:
+        await self._smtp.rset()
+
+    async def close(self) -> None:
+        if self._smtp is None:
+            return
+        try:
+            await self._smtp.quit()
+        except (aiosmtplib.SMTPException, OSError):
+            self._smtp.close()
+        self._smtp = None
+
+_idle: Deque[SMTPConnection] = deque()
+_slots = asyncio.Semaphore(POOL_MAX_CONNECTIONS)
+
+@asynccontextmanager
+async def acquire() -> AsyncIterator[SMTPConnection]:
+    """
+    Borrow a connected session for the configured SMTP server, waiting while all are in use.
+    Sessions that raised or reached MAX_MESSAGES_PER_CONNECTION are closed rather than returned.
+    """
+    async with _slots:
+        connection = _idle.popleft() if _idle else SMTPConnection()
+        try:
+            await connection.ensure_connected()
+            yield connection
+        except BaseException:
+            await connection.close()
+            raise
+
+        if connection.messages_sent >= MAX_MESSAGES_PER_CONNECTION:
+            await connection.close()
+        else:
+            _idle.append(connection)
+
+async def close_all() -> None:
+    """Quit every idle session; called on shutdown"""
+    closed = 0
+    while _idle:
+        await _idle.popleft().close()
+        closed += 1
+    if closed:
+        logger.info("Closed %d pooled SMTP connections", closed)
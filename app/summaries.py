@@ -0,0 +1,64 @@
+import asyncio
+import logging
+from typing import Optional
+
+from sqlalchemy import text
+
+from .database import async_engine
+from .models import PROPHECY_DAILY_COUNTS_DDL
+
+logger = logging.getLogger(__name__)
+
+# How often precomputed summary views are rebuilt from their base tables
+SUMMARY_REFRESH_INTERVAL_SECONDS = 3600
+
+_worker: Optional[asyncio.Task] = None
+
+# Set once the view is known to exist; readers fall back to the base table until then
+prophecy_daily_counts_ready = False
+
+async def ensure_prophecy_daily_counts() -> None:
+    """Create the view and its unique index if this database predates them"""
+    global prophecy_daily_counts_ready
+    if async_engine.dialect.name != "postgresql":
+        return
+    async with async_engine.begin() as conn:
+        for statement in PROPHECY_DAILY_COUNTS_DDL:
+            await conn.execute(text(statement))
+    prophecy_daily_counts_ready = True
+
+async def refresh_prophecy_daily_counts() -> None:
+    """Rebuild prophecy_daily_counts without blocking readers of the view"""
+    if async_engine.dialect.name != "postgresql":
+        return
+    async with async_engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY prophecy_daily_counts"))
+
+async def _run_refreshes() -> None:
+    """Create missing summary views, then refresh every view once per interval"""
+    while True:
+        try:
+            if not prophecy_daily_counts_ready:
+                await ensure_prophecy_daily_counts()
+            await refresh_prophecy_daily_counts()
+        except Exception as e:
+            logger.error("Failed to refresh prophecy_daily_counts: %s", e)
+        await asyncio.sleep(SUMMARY_REFRESH_INTERVAL_SECONDS)
+
+def start() -> None:
+    """Start the periodic refresh task on the running event loop"""
+    global _worker
+    if _worker is None or _worker.done():
+        _worker = asyncio.create_task(_run_refreshes())
+
+async def stop() -> None:
+    """Cancel the periodic refresh task"""
+    global _worker
+    if _worker is not None:
+        _worker.cancel()
+        try:
+            await _worker
+        except asyncio.CancelledError:
+            pass
+        _worker = None
@@ -0,0 +1,42 @@
+import hashlib
+import threading
+import time
+from typing import Optional
+
+from cachetools import TTLCache
+
+# Upper bound on how long verified claims are reused, even if the token lives longer
+TOKEN_CACHE_TTL_SECONDS = 60
+
+_cache: TTLCache = TTLCache(maxsize=10_000, ttl=TOKEN_CACHE_TTL_SECONDS)
+_lock = threading.Lock()
+
+def _cache_key(token: str) -> bytes:
+    """Hash the raw token so bearer credentials are never kept in memory as keys"""
+    return hashlib.sha256(token.encode()).digest()
+
+def get_cached_claims(token: str) -> Optional[dict]:
+    """Return previously verified claims for this token, or None if absent or expired"""
+    key = _cache_key(token)
+    with _lock:
+        entry = _cache.get(key)
+    if entry is None:
+        return None
+
+    claims, expires_at = entry
+    if expires_at <= time.time():
+        with _lock:
+            _cache.pop(key, None)
+        return None
+    return claims
+
+def cache_claims(token: str, claims: dict) -> None:
+    """Store verified claims until min(token exp, TTL cap)"""
+    now = time.time()
+    exp = claims.get("exp")
+    expires_at = min(exp, now + TOKEN_CACHE_TTL_SECONDS) if exp else now + TOKEN_CACHE_TTL_SECONDS
+    if expires_at <= now:
+        return
+
+    with _lock:
+        _cache[_cache_key(token)] = (claims, expires_at)